@@ -17,9 +17,24 @@ logger = logging.getLogger(__name__)
 # Security
 security = HTTPBearer(auto_error=False)
 
+# Shared clients, created on first use. SDK clients pool their connections
+# and are meant to be reused; the local database client creates its schema
+# on construction.
+_cosmos_client = None
+_blob_service_client = None
+_service_bus_client = None
+
 
 def get_cosmos_client():
-    """Get database client (SQLite in local mode, Cosmos DB otherwise)."""
+    """Get the shared database client (SQLite in local mode, Cosmos DB otherwise)."""
+    global _cosmos_client
+    if _cosmos_client is None:
+        _cosmos_client = _create_cosmos_client()
+    return _cosmos_client
+
+
+def _create_cosmos_client():
+    """Create database client (SQLite in local mode, Cosmos DB otherwise)."""
     settings = get_settings()
 
     if settings.use_local_mode:
@@ -45,7 +60,15 @@ def get_cosmos_client():
 
 
 def get_blob_service_client():
-    """Get storage client (filesystem in local mode, Blob Storage otherwise)."""
+    """Get the shared storage client (filesystem in local mode, Blob Storage otherwise)."""
+    global _blob_service_client
+    if _blob_service_client is None:
+        _blob_service_client = _create_blob_service_client()
+    return _blob_service_client
+
+
+def _create_blob_service_client():
+    """Create storage client (filesystem in local mode, Blob Storage otherwise)."""
     settings = get_settings()
 
     if settings.use_local_mode:
@@ -69,7 +92,15 @@ def get_blob_service_client():
 
 
 def get_service_bus_client():
-    """Get Service Bus client (None in local mode)."""
+    """Get the shared Service Bus client (None in local mode)."""
+    global _service_bus_client
+    if _service_bus_client is None:
+        _service_bus_client = _create_service_bus_client()
+    return _service_bus_client
+
+
+def _create_service_bus_client():
+    """Create Service Bus client (None in local mode)."""
     settings = get_settings()
 
     if settings.use_local_mode:
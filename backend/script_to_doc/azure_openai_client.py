@@ -7,13 +7,21 @@ This ensures LLM capabilities are maintained even if Azure OpenAI fails.
 """
 
 import asyncio
+import json
 import logging
+import time
 from typing import Dict, List, Tuple, Optional
 from openai import AzureOpenAI, OpenAI, AsyncAzureOpenAI, AsyncOpenAI
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
 
 logger = logging.getLogger(__name__)
 
+# Batch API polling: start at 5s, back off to one check a minute, give up after 24h
+BATCH_POLL_INTERVAL = 5.0
+BATCH_MAX_POLL_INTERVAL = 60.0
+BATCH_MAX_WAIT = 24 * 3600.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
 
 class AzureOpenAIClient:
     """
@@ -463,31 +471,7 @@ class AzureOpenAIClient:
             content = response.choices[0].message.content
 
             # Parse the single step from response
-            # The response should contain ONE step in the standard format
-            steps = self._parse_steps_response(content)
-
-            if not steps or len(steps) == 0:
-                logger.warning(f"No step generated from chunk {chunk_index}, using fallback")
-                # Create fallback step
-                step = {
-                    "title": f"Step {chunk_index}: Process from transcript",
-                    "summary": chunk[:200] + "..." if len(chunk) > 200 else chunk,
-                    "details": chunk,
-                    "actions": []
-                }
-            else:
-                # Take the first step (should only be one)
-                step = steps[0]
-
-                # Ensure step has proper structure
-                if "title" not in step:
-                    step["title"] = f"Step {chunk_index}"
-                if "summary" not in step:
-                    step["summary"] = chunk[:200]
-                if "details" not in step:
-                    step["details"] = chunk
-                if "actions" not in step:
-                    step["actions"] = []
+            step = self._step_from_content(content, chunk, chunk_index)
 
             usage = {
                 "input_tokens": response.usage.prompt_tokens,
@@ -568,27 +552,7 @@ class AzureOpenAIClient:
             content = response.choices[0].message.content
 
             # Parse the step
-            steps = self._parse_steps_response(content)
-
-            if not steps or len(steps) == 0:
-                logger.warning(f"No step generated from chunk {chunk_index}, using fallback")
-                step = {
-                    "title": f"Step {chunk_index}: Process from transcript",
-                    "summary": chunk[:200] + "..." if len(chunk) > 200 else chunk,
-                    "details": chunk,
-                    "actions": []
-                }
-            else:
-                step = steps[0]
-                # Ensure proper structure
-                if "title" not in step:
-                    step["title"] = f"Step {chunk_index}"
-                if "summary" not in step:
-                    step["summary"] = chunk[:200]
-                if "details" not in step:
-                    step["details"] = chunk
-                if "actions" not in step:
-                    step["actions"] = []
+            step = self._step_from_content(content, chunk, chunk_index)
 
             usage = {
                 "input_tokens": response.usage.prompt_tokens,
@@ -617,6 +581,183 @@ class AzureOpenAIClient:
             }
             return fallback_step, fallback_usage
 
+    @property
+    def supports_batch_api(self) -> bool:
+        """Whether the installed openai SDK exposes the Batch API."""
+        return hasattr(self.client, "batches")
+
+    def generate_steps_from_chunks_batch(
+        self,
+        chunks: List[str],
+        tone: str = "Professional",
+        audience: str = "Technical Users",
+        knowledge_sources: Optional[List[Dict]] = None,
+        knowledge_fetcher = None,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        max_wait: float = BATCH_MAX_WAIT
+    ) -> Tuple[List[Dict], Dict, Optional[str]]:
+        """
+        Generate one training step per chunk through the OpenAI Batch API.
+
+        All chunk prompts are submitted as a single JSONL batch job instead of
+        one request per chunk, at roughly half the per-token price. Batches
+        complete asynchronously (up to a 24h window), so this suits bulk and
+        CI runs rather than interactive jobs. On Azure the deployment must be
+        a Global Batch deployment and api_version 2024-07-01-preview or later.
+
+        Args:
+            chunks: Transcript chunks, one step each
+            tone: Tone for instructions
+            audience: Target audience
+            knowledge_sources: Optional knowledge base content
+            knowledge_fetcher: Optional fetcher for intelligent extraction
+            poll_interval: Initial seconds between status checks (doubles up to 60s)
+            max_wait: Seconds to wait for the batch before cancelling it
+
+        Returns:
+            Tuple of (steps_list, token_usage_dict, first_error_string), the
+            same shape as the pipeline's parallel generation. Steps keep chunk
+            order; chunks whose request failed are left out.
+
+        Raises:
+            RuntimeError: If the SDK lacks the Batch API or the batch fails
+            TimeoutError: If the batch does not finish within max_wait
+        """
+        if not self.supports_batch_api:
+            raise RuntimeError("Installed openai SDK does not support the Batch API")
+
+        model_name = self.openai_model if self.use_fallback else self.deployment
+        url = "/v1/chat/completions" if self.use_fallback else "/chat/completions"
+
+        lines = []
+        for i, chunk in enumerate(chunks, 1):
+            prompt = self._build_chunk_prompt(
+                chunk,
+                i,
+                len(chunks),
+                tone,
+                audience,
+                knowledge_sources,
+                knowledge_fetcher
+            )
+            lines.append(json.dumps({
+                "custom_id": f"step-{i}",
+                "method": "POST",
+                "url": url,
+                "body": {
+                    "model": model_name,
+                    "messages": [
+                        {"role": "system", "content": self._get_system_prompt("training_steps")},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.2,
+                    "max_tokens": 1000,
+                    "top_p": 0.85
+                }
+            }))
+
+        batch_file = self.client.files.create(
+            file=("steps.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=url,
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(chunks)} step requests")
+
+        # Poll with exponential backoff until the batch settles
+        deadline = time.monotonic() + max_wait
+        delay = poll_interval
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                self.client.batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} did not finish within {max_wait:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_MAX_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        # Index results by custom_id; failed requests land in the error file
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                for line in self.client.files.content(file_id).text.splitlines():
+                    if line.strip():
+                        entry = json.loads(line)
+                        results[entry["custom_id"]] = entry
+
+        steps = []
+        total_input_tokens = 0
+        total_output_tokens = 0
+        total_tokens = 0
+        first_error = None
+
+        for i, chunk in enumerate(chunks, 1):
+            entry = results.get(f"step-{i}")
+            response = entry.get("response") if entry else None
+            if not response or response.get("status_code") != 200:
+                error = (entry or {}).get("error") or (response or {}).get("body") or "no result returned"
+                logger.error(f"Batch step {i} generation failed: {error}")
+                if first_error is None:
+                    first_error = str(error)
+                continue
+
+            body = response["body"]
+            steps.append(self._step_from_content(body["choices"][0]["message"]["content"], chunk, i))
+
+            usage = body.get("usage", {})
+            total_input_tokens += usage.get("prompt_tokens", 0)
+            total_output_tokens += usage.get("completion_tokens", 0)
+            total_tokens += usage.get("total_tokens", 0)
+
+        token_usage = {
+            "input_tokens": total_input_tokens,
+            "output_tokens": total_output_tokens,
+            "total_tokens": total_tokens
+        }
+
+        logger.info(f"Batch {batch.id} complete: {len(steps)}/{len(chunks)} steps, {total_tokens} total tokens")
+
+        return steps, token_usage, first_error
+
+    def _step_from_content(self, content: str, chunk: str, chunk_index: int) -> Dict:
+        """
+        Turn a single-step completion into a step dict.
+
+        Falls back to a step built from the chunk text when nothing parses,
+        and fills in any missing fields.
+        """
+        # The response should contain ONE step in the standard format
+        steps = self._parse_steps_response(content)
+
+        if not steps:
+            logger.warning(f"No step generated from chunk {chunk_index}, using fallback")
+            return {
+                "title": f"Step {chunk_index}: Process from transcript",
+                "summary": chunk[:200] + "..." if len(chunk) > 200 else chunk,
+                "details": chunk,
+                "actions": []
+            }
+
+        # Take the first step (should only be one)
+        step = steps[0]
+
+        # Ensure step has proper structure
+        if "title" not in step:
+            step["title"] = f"Step {chunk_index}"
+        if "summary" not in step:
+            step["summary"] = chunk[:200]
+        if "details" not in step:
+            step["details"] = chunk
+        if "actions" not in step:
+            step["actions"] = []
+
+        return step
+
     def suggest_step_count(self, transcript: str, complexity_factors: Dict) -> int:
         """
         Suggest optimal number of steps based on content analysis.
@@ -8,11 +8,60 @@ import sqlite3
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
 
+# Optional C JSON codec for the config/input/result columns
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Job IDs bound per DELETE statement in delete_many
+_DELETE_BATCH_SIZE = 500
+
+# Rows pulled from the cursor per fetchmany() call in query_items
+_FETCH_BATCH_SIZE = 1000
+
+# Per-connection pragmas for throwaway databases: no fsync, rollback journal in RAM
+_NON_DURABLE_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _dumps(value: Any) -> str:
+    """
+    Serialize a JSON column value, preferring orjson when installed.
+
+    orjson writes NaN and infinities as null, so any output containing null
+    is redone with json.dumps, which keeps them as NaN/Infinity and reads
+    back as floats.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles them
+        else:
+            if b"null" not in data:
+                return data.decode()
+    return json.dumps(value)
+
+
+def _loads(text: str) -> Any:
+    """Parse a JSON column value, preferring orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN written by json.dumps in older rows
+    return json.loads(text)
+
 
 class LocalDBClient:
     """
@@ -22,14 +71,18 @@ class LocalDBClient:
     but uses local SQLite database instead of Azure.
     """
 
-    def __init__(self, db_path: str = "./data/scripttodoc.db"):
+    def __init__(self, db_path: str = "./data/scripttodoc.db", durable: bool = True):
         """
         Initialize local database client.
 
         Args:
             db_path: Path to SQLite database file
+            durable: Keep SQLite's default fsync-on-commit. Pass False for
+                throwaway databases (e.g. the infrastructure test scripts)
+                to skip syncs; a crash may then corrupt the file.
         """
         self.db_path = db_path
+        self._pragmas = () if durable else _NON_DURABLE_PRAGMAS
 
         # Ensure data directory exists
         db_file = Path(db_path)
@@ -39,9 +92,16 @@ class LocalDBClient:
         self._ensure_schema()
         logger.info(f"Initialized LocalDBClient with database: {db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with this client's pragmas applied."""
+        conn = sqlite3.connect(self.db_path)
+        for pragma in self._pragmas:
+            conn.execute(pragma)
+        return conn
+
     def _ensure_schema(self):
         """Create jobs table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -82,9 +142,9 @@ class LocalDBClient:
             item.get('stage_detail'),
             item.get('created_at'),
             item.get('updated_at'),
-            json.dumps(item.get('config')) if item.get('config') else None,
-            json.dumps(item.get('input')) if item.get('input') else None,
-            json.dumps(item.get('result')) if item.get('result') else None,
+            _dumps(item.get('config')) if item.get('config') else None,
+            _dumps(item.get('input')) if item.get('input') else None,
+            _dumps(item.get('result')) if item.get('result') else None,
             item.get('error')
         )
 
@@ -96,7 +156,7 @@ class LocalDBClient:
         for field in ['config', 'input', 'result']:
             if item.get(field):
                 try:
-                    item[field] = json.loads(item[field])
+                    item[field] = _loads(item[field])
                 except json.JSONDecodeError:
                     logger.warning(f"Failed to parse {field} JSON")
                     item[field] = None
@@ -113,7 +173,7 @@ class LocalDBClient:
         Returns:
             Created item dictionary
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             # Ensure timestamps exist
             if 'created_at' not in item:
@@ -150,7 +210,7 @@ class LocalDBClient:
         Returns:
             Job data dictionary
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             cursor = conn.execute(
                 "SELECT * FROM jobs WHERE id = ? AND user_id = ?",
@@ -179,7 +239,7 @@ class LocalDBClient:
         Returns:
             Updated item dictionary
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             # Update timestamp
             item['updated_at'] = datetime.utcnow().isoformat()
@@ -209,7 +269,7 @@ class LocalDBClient:
         parameters: Optional[List] = None,
         partition_key: Optional[str] = None,
         max_item_count: int = 100
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """
         Query job records.
 
@@ -222,10 +282,11 @@ class LocalDBClient:
             partition_key: User ID to filter by
             max_item_count: Maximum items to return
 
-        Returns:
-            List of job dictionaries
+        Yields:
+            Job dictionaries, streamed from the cursor like Cosmos DB's
+            paged iterator
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             # Simplified query for local mode: get all jobs for user, ordered by created_at
             if partition_key:
@@ -248,12 +309,17 @@ class LocalDBClient:
                     (max_item_count,)
                 )
 
-            rows = cursor.fetchall()
             columns = [desc[0] for desc in cursor.description]
 
-            items = [self._row_to_dict(row, columns) for row in rows]
-            logger.debug(f"Query returned {len(items)} jobs")
-            return items
+            count = 0
+            while True:
+                rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_dict(row, columns)
+                count += len(rows)
+            logger.debug(f"Query returned {count} jobs")
         finally:
             conn.close()
 
@@ -265,7 +331,7 @@ class LocalDBClient:
             item_id: Job ID
             partition_key: User ID
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         try:
             conn.execute(
                 "DELETE FROM jobs WHERE id = ? AND user_id = ?",
@@ -276,6 +342,35 @@ class LocalDBClient:
         finally:
             conn.close()
 
+    def delete_many(self, item_ids: List[str], partition_key: str) -> int:
+        """
+        Delete several job records for one user in a single transaction.
+
+        Args:
+            item_ids: Job IDs
+            partition_key: User ID
+
+        Returns:
+            Number of jobs deleted
+        """
+        conn = self._connect()
+        try:
+            deleted = 0
+            # Stay well under SQLite's bound-parameter limit per statement
+            for start in range(0, len(item_ids), _DELETE_BATCH_SIZE):
+                batch = item_ids[start:start + _DELETE_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"DELETE FROM jobs WHERE id IN ({placeholders}) AND user_id = ?",
+                    (*batch, partition_key)
+                )
+                deleted += cursor.rowcount
+            conn.commit()
+            logger.info(f"Deleted {deleted} jobs for user: {partition_key}")
+            return deleted
+        finally:
+            conn.close()
+
 
 class LocalDatabaseClient:
     """
@@ -321,7 +416,7 @@ class LocalContainerClient:
         parameters: Optional[List] = None,
         partition_key: Optional[str] = None,
         max_item_count: int = 100
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """Query items with Cosmos DB API."""
         return self.db_client.query_items(query, parameters, partition_key, max_item_count)
 
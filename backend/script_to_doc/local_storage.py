@@ -5,8 +5,10 @@ Provides Blob Storage-compatible API for local development without Azure subscri
 """
 
 import logging
+import os
+import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional
 from io import BytesIO
 
 logger = logging.getLogger(__name__)
@@ -264,37 +266,42 @@ class LocalContainerClient:
         # Ensure container directory exists
         self.container_path.mkdir(parents=True, exist_ok=True)
 
-    def list_blobs(self, name_starts_with: Optional[str] = None) -> List[dict]:
+    def list_blobs(self, name_starts_with: Optional[str] = None) -> Iterator[dict]:
         """
         List blobs in container.
 
         Args:
             name_starts_with: Optional prefix filter
 
-        Returns:
-            List of blob metadata dictionaries
+        Yields:
+            Blob metadata dictionaries, one per file, as the directory
+            tree is walked
         """
         if not self.container_path.exists():
-            return []
-
-        blobs = []
-        for file_path in self.container_path.rglob('*'):
-            if file_path.is_file():
-                # Get relative path from container
-                rel_path = file_path.relative_to(self.container_path)
-                blob_name = str(rel_path).replace('\\', '/')
-
-                # Apply prefix filter if specified
-                if name_starts_with and not blob_name.startswith(name_starts_with):
-                    continue
-
-                blobs.append({
-                    'name': blob_name,
-                    'size': file_path.stat().st_size,
-                    'last_modified': file_path.stat().st_mtime,
-                })
-
-        return blobs
+            return
+
+        pending = [(str(self.container_path), '')]
+        while pending:
+            dir_path, prefix = pending.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    blob_name = prefix + entry.name
+                    if entry.is_dir():
+                        pending.append((entry.path, blob_name + '/'))
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    # Apply prefix filter if specified
+                    if name_starts_with and not blob_name.startswith(name_starts_with):
+                        continue
+
+                    stat = entry.stat()
+                    yield {
+                        'name': blob_name,
+                        'size': stat.st_size,
+                        'last_modified': stat.st_mtime,
+                    }
 
     def delete_blob(self, blob_name: str):
         """
@@ -308,6 +315,12 @@ class LocalContainerClient:
             blob_path.unlink()
             logger.info(f"Deleted blob: {blob_name}")
 
+    def delete_container(self):
+        """Delete the container and all of its blobs in one call."""
+        if self.container_path.exists():
+            shutil.rmtree(self.container_path)
+            logger.info(f"Deleted container: {self.container_name}")
+
     def get_blob_client(self, blob: str) -> LocalBlobClient:
         """
         Get blob client.
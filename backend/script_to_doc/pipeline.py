@@ -6,13 +6,14 @@ Orchestrates the end-to-end flow from transcript to document.
 import asyncio
 import logging
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 
-from .transcript_cleaner import TranscriptCleaner, SentenceTokenizer, TranscriptChunker
+from .transcript_cleaner import TranscriptCleaner, TranscriptChunker, get_sentence_tokenizer
 from .transcript_parser import TranscriptParser  # Phase 1: Intelligent parsing
-from .topic_segmenter import TopicSegmenter  # Phase 1: Topic segmentation
+from .topic_segmenter import TopicSegmenter, SegmentationConfig  # Phase 1: Topic segmentation
 from .qa_filter import QAFilter, FilterConfig  # Phase 2: Q&A filtering
 from .topic_ranker import TopicRanker, RankingConfig  # Phase 2: Topic ranking
 from .step_validator import StepValidator, ValidationConfig  # Phase 2: Step validation
@@ -26,7 +27,7 @@ from .action_validator import ActionValidator
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Configuration for the processing pipeline."""
 
@@ -48,6 +49,8 @@ class PipelineConfig:
     # Processing options
     use_azure_di: bool = False             # CHANGED: Disabled by default in local mode
     use_openai: bool = True
+    use_batch_api: bool = False            # Submit step generation as one Batch API job (bulk/CI runs)
+    max_concurrent_requests: int = 10      # Cap on in-flight step-generation calls in parallel mode
     use_managed_identity: bool = False
 
     # Phase 1: Intelligent parsing options
@@ -125,7 +128,7 @@ class ScriptToDocPipeline:
         self.transcript_cleaner = TranscriptCleaner(
             custom_filler_words=config.custom_filler_words
         )
-        self.sentence_tokenizer = SentenceTokenizer()
+        self.sentence_tokenizer = get_sentence_tokenizer()
         self.transcript_chunker = TranscriptChunker(self.sentence_tokenizer)
         self.source_manager = SourceReferenceManager()
         self.knowledge_fetcher = KnowledgeFetcher()
@@ -171,7 +174,8 @@ class ScriptToDocPipeline:
                 logger.warning("Topic ranking requires topic segmentation. Enabling segmentation automatically.")
                 if not self.transcript_parser:
                     self.transcript_parser = TranscriptParser()
-                self.topic_segmenter = TopicSegmenter()
+            # Ranking weighs segment coherence, which the segmenter skips by default
+            self.topic_segmenter = TopicSegmenter(SegmentationConfig(compute_coherence=True))
             ranking_config = RankingConfig(
                 min_importance_threshold=config.importance_threshold
             )
@@ -236,6 +240,10 @@ class ScriptToDocPipeline:
             PipelineResult with success status and metrics
         """
         start_time = time.time()
+        # Source matching is CPU-bound, so a worker overlaps it with API calls.
+        # max_workers=1 is required for correctness: matching updates the
+        # sentence reuse counts and must run one step at a time, in step order.
+        source_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="step-sources")
         
         try:
             logger.info("Starting pipeline processing")
@@ -362,11 +370,12 @@ class ScriptToDocPipeline:
                 # Convert topic segments to text chunks
                 chunks = [seg.get_text() for seg in topic_segments]
 
-                # Log segment characteristics
+                # Log segment characteristics (coherence is only scored when ranking needs it)
+                log_coherence = self.topic_segmenter.config.compute_coherence
                 for i, seg in enumerate(topic_segments, 1):
+                    coherence = f"coherence={seg.coherence_score:.2f}, " if log_coherence else ""
                     logger.debug(
-                        f"Segment {i}: {len(seg.sentences)} sentences, "
-                        f"coherence={seg.coherence_score:.2f}, "
+                        f"Segment {i}: {len(seg.sentences)} sentences, {coherence}"
                         f"transition={seg.has_transition_start}, "
                         f"qa={seg.has_qa_section}"
                     )
@@ -414,20 +423,61 @@ class ScriptToDocPipeline:
                     stage_detail=f"Determined {len(chunks)} steps (legacy chunking)"
                 )
 
-            # Generate steps - try parallel async first, fallback to sequential if needed
+            use_batch_api = self.config.use_batch_api and self.azure_openai.supports_batch_api
+            if self.config.use_batch_api and not use_batch_api:
+                logger.warning("Batch API requested but not supported by the installed openai SDK, using parallel generation")
+
+            # Match sources for each step on a worker thread as soon as it is
+            # generated, while the remaining steps are still being requested
+            source_futures: Dict[int, Tuple[Dict, Future]] = {}
+            used_sentences = dict(self.source_manager.used_sentences)
+
+            def prefetch_sources(step: Dict) -> None:
+                source_futures[id(step)] = (step, source_executor.submit(
+                    self.source_manager.find_sources_for_step_dict,
+                    step,
+                    sentences,
+                    screenshots_data=screenshots_data,
+                    knowledge_sources=knowledge_sources
+                ))
+
+            # Generate steps - batch or parallel async first, fallback to sequential if needed
             try:
-                import asyncio
-                logger.info(f"Attempting parallel step generation for {len(chunks)} steps")
-                steps, token_usage, first_error = asyncio.run(
-                    self._generate_steps_parallel(
+                if use_batch_api:
+                    logger.info(f"Submitting batch step generation for {len(chunks)} steps")
+                    steps, token_usage, first_error = self.azure_openai.generate_steps_from_chunks_batch(
                         chunks,
-                        knowledge_sources,
-                        progress_callback
+                        tone=self.config.tone,
+                        audience=self.config.audience,
+                        knowledge_sources=knowledge_sources,
+                        knowledge_fetcher=self.knowledge_fetcher
                     )
-                )
-                logger.info(f"Parallel generation complete: {len(steps)} steps generated")
+                    self._update_progress(
+                        progress_callback, 0.60, "generate_steps",
+                        current_step=len(chunks),
+                        total_steps=len(chunks),
+                        stage_detail=f"Generated {len(steps)} of {len(chunks)} steps in one batch"
+                    )
+                else:
+                    logger.info(f"Attempting parallel step generation for {len(chunks)} steps")
+                    steps, token_usage, first_error = asyncio.run(
+                        self._generate_steps_parallel(
+                            chunks,
+                            knowledge_sources,
+                            progress_callback,
+                            on_step=prefetch_sources
+                        )
+                    )
+                    logger.info(f"Parallel generation complete: {len(steps)} steps generated")
             except Exception as async_error:
-                logger.warning(f"Parallel generation failed ({async_error}), falling back to sequential")
+                logger.warning(f"{'Batch' if use_batch_api else 'Parallel'} generation failed ({async_error}), falling back to sequential")
+                # Discard matches from the failed attempt so reuse penalties start over
+                for _, future in source_futures.values():
+                    future.cancel()
+                wait([future for _, future in source_futures.values()])
+                source_futures.clear()
+                self.source_manager.used_sentences = used_sentences
+
                 # Fallback to sequential generation
                 steps = []
                 total_input_tokens = 0
@@ -450,6 +500,7 @@ class ScriptToDocPipeline:
                         )
 
                         steps.append(step)
+                        prefetch_sources(step)
 
                         # Aggregate token usage
                         total_input_tokens += usage.get('input_tokens', 0)
@@ -515,12 +566,14 @@ class ScriptToDocPipeline:
                     stage_detail=f"Building citations for step {i} of {total_steps_for_sources}"
                 )
 
+                prefetched = source_futures.get(id(step))
                 source_data = self.source_manager.build_step_sources(
                     step_index=i,
                     step_dict=step,
                     transcript_sentences=sentences,
                     screenshots_data=screenshots_data,
-                    knowledge_sources=knowledge_sources
+                    knowledge_sources=knowledge_sources,
+                    sources=prefetched[1].result() if prefetched and prefetched[0] is step else None
                 )
                 step_sources.append(source_data)
 
@@ -803,6 +856,8 @@ class ScriptToDocPipeline:
                 error=str(e),
                 processing_time=processing_time
             )
+        finally:
+            source_executor.shutdown(cancel_futures=True)
     
     def _enhance_steps_with_transcript(self, steps: List[Dict], sentences: List[str], transcript: str) -> List[Dict]:
         """
@@ -908,7 +963,8 @@ class ScriptToDocPipeline:
         self,
         chunks: List[str],
         knowledge_sources: Optional[List[Dict]],
-        progress_callback: Optional[Callable[[float, str], None]] = None
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        on_step: Optional[Callable[[Dict], None]] = None
     ) -> Tuple[List[Dict], Dict, Optional[str]]:
         """
         Generate steps from chunks in parallel using async API calls.
@@ -917,31 +973,58 @@ class ScriptToDocPipeline:
         - Sequential: ~3s per step = 24s for 8 steps
         - Parallel: ~3-6s total for 8 steps (limited by API concurrency)
 
+        At most config.max_concurrent_requests calls are in flight at once, so
+        long transcripts do not burst past the deployment's rate limit. The
+        openai SDK already retries rate-limited and timed-out calls with
+        exponential backoff.
+
         Args:
             chunks: List of transcript chunks
             knowledge_sources: Optional knowledge base content
             progress_callback: Progress update callback
+            on_step: Called with each step, in chunk order, as soon as it and
+                every earlier step have arrived
 
         Returns:
             Tuple of (steps_list, token_usage_dict, first_error_string)
         """
-        import asyncio
-
         logger.info(f"Starting parallel generation of {len(chunks)} steps")
 
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+
+        # Steps finished ahead of an earlier chunk wait here, so on_step sees chunk order
+        finished: Dict[int, Optional[Dict]] = {}
+        next_index = 1
+
+        def release(i: int, step: Optional[Dict]) -> None:
+            nonlocal next_index
+            finished[i] = step
+            while next_index in finished:
+                ready = finished.pop(next_index)
+                if ready is not None and on_step:
+                    on_step(ready)
+                next_index += 1
+
+        async def generate(i: int, chunk: str) -> Tuple[Dict, Dict]:
+            try:
+                async with semaphore:
+                    result = await self.azure_openai.generate_step_from_chunk_async(
+                        chunk=chunk,
+                        chunk_index=i,
+                        total_chunks=len(chunks),
+                        tone=self.config.tone,
+                        audience=self.config.audience,
+                        knowledge_sources=knowledge_sources,
+                        knowledge_fetcher=self.knowledge_fetcher
+                    )
+            except Exception:
+                release(i, None)
+                raise
+            release(i, result[0])
+            return result
+
         # Create async tasks for all chunks
-        tasks = []
-        for i, chunk in enumerate(chunks, 1):
-            task = self.azure_openai.generate_step_from_chunk_async(
-                chunk=chunk,
-                chunk_index=i,
-                total_chunks=len(chunks),
-                tone=self.config.tone,
-                audience=self.config.audience,
-                knowledge_sources=knowledge_sources,
-                knowledge_fetcher=self.knowledge_fetcher
-            )
-            tasks.append(task)
+        tasks = [generate(i, chunk) for i, chunk in enumerate(chunks, 1)]
 
         # Execute all tasks in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -889,13 +889,51 @@ class SourceReferenceManager:
         
         return is_valid, warnings
     
+    def find_sources_for_step_dict(
+        self,
+        step_dict: Dict,
+        transcript_sentences: List[str],
+        screenshots_data: Optional[List[Dict]] = None,
+        knowledge_sources: Optional[List[Dict]] = None
+    ) -> List[SourceReference]:
+        """
+        Find source references for a step dictionary.
+
+        Not thread-safe: matching updates the sentence reuse counts, so
+        later steps score lower for reused sentences. Call it from one
+        thread, in step order, as build_step_sources would.
+
+        Args:
+            step_dict: Step dictionary with title, summary, details, actions
+            transcript_sentences: All transcript sentences
+            screenshots_data: Optional screenshot data
+            knowledge_sources: Optional knowledge base content
+
+        Returns:
+            List of SourceReference objects
+        """
+        return self.find_sources_for_step(
+            step_content=self._step_content(step_dict),
+            step_title=step_dict.get("title", ""),
+            step_actions=step_dict.get("actions", []),
+            transcript_sentences=transcript_sentences,
+            screenshots_data=screenshots_data,
+            knowledge_sources=knowledge_sources
+        )
+
+    @staticmethod
+    def _step_content(step_dict: Dict) -> str:
+        """Text of a step that is matched against its sources."""
+        return f"{step_dict.get('summary', '')} {step_dict.get('details', '')}"
+
     def build_step_sources(
         self,
         step_index: int,
         step_dict: Dict,
         transcript_sentences: List[str],
         screenshots_data: Optional[List[Dict]] = None,
-        knowledge_sources: Optional[List[Dict]] = None
+        knowledge_sources: Optional[List[Dict]] = None,
+        sources: Optional[List[SourceReference]] = None
     ) -> StepSourceData:
         """
         Build complete source data for a step.
@@ -907,24 +945,20 @@ class SourceReferenceManager:
             step_dict: Step dictionary with title, summary, details, actions
             transcript_sentences: All transcript sentences
             screenshots_data: Optional screenshot data
+            knowledge_sources: Optional knowledge base content
+            sources: Matches already found by find_sources_for_step_dict;
+                computed here when omitted
             
         Returns:
             StepSourceData with all source information
         """
-        # Extract step components
-        step_title = step_dict.get("title", "")
-        step_summary = step_dict.get("summary", "")
-        step_details = step_dict.get("details", "")
-        step_actions = step_dict.get("actions", [])
-        
-        step_content = f"{step_summary} {step_details}"
+        step_content = self._step_content(step_dict)
         
         # Find sources using similarity matching (for LLM-generated steps)
-        sources = self.find_sources_for_step(
-                step_content=step_content,
-                step_title=step_title,
-                step_actions=step_actions,
-                transcript_sentences=transcript_sentences,
+        if sources is None:
+            sources = self.find_sources_for_step_dict(
+                step_dict,
+                transcript_sentences,
                 screenshots_data=screenshots_data,
                 knowledge_sources=knowledge_sources
             )
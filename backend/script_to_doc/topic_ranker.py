@@ -6,18 +6,32 @@ Scores segments based on action density, coherence, and procedural indicators.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+from operator import attrgetter
+import heapq
 import logging
 import re
 
+import numpy as np
+
 # Import Phase 1 components
-from .topic_segmenter import TopicSegment
+from .topic_segmenter import (
+    TopicSegment,
+    DEFAULT_ACTION_VERBS,
+    DEFAULT_SEQUENCE_INDICATORS,
+    count_procedural_indicators,
+)
 from .transcript_parser import ParsedSentence
 
 logger = logging.getLogger(__name__)
 
+_get_importance = attrgetter("importance_score")
+
+# Report bucket edges: [0, 0.3) low, [0.3, 0.7) medium, [0.7, 1.0] high
+IMPORTANCE_BUCKET_EDGES = (0.3, 0.7)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TopicScore:
     """
     Importance score for a topic segment.
@@ -30,13 +44,21 @@ class TopicScore:
     action_density: float         # Actions per sentence
     coherence_score: float        # Topic coherence (from segmenter)
 
-    # Score breakdown (for debugging)
-    weighted_procedural: float = 0.0
-    weighted_action_density: float = 0.0
-    weighted_coherence: float = 0.0
+    # Score breakdown (for debugging) - computed on demand from raw scores
+    def weighted_procedural(self, config: "RankingConfig") -> float:
+        """Procedural score scaled by its ranking weight."""
+        return self.procedural_score * config.weight_procedural
+
+    def weighted_action_density(self, config: "RankingConfig") -> float:
+        """Action density scaled by its ranking weight."""
+        return self.action_density * config.weight_action_density
 
+    def weighted_coherence(self, config: "RankingConfig") -> float:
+        """Coherence score scaled by its ranking weight."""
+        return self.coherence_score * config.weight_coherence
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RankingConfig:
     """Configuration for topic ranking."""
 
@@ -55,30 +77,12 @@ class RankingConfig:
 
     def __post_init__(self):
         """Initialize default action verbs and sequence indicators."""
+        # Frozen dataclass: defaults must bypass __setattr__
         if self.action_verbs is None:
-            self.action_verbs = [
-                # Navigation
-                "navigate", "go", "open", "access", "visit", "browse",
-                # Interaction
-                "click", "select", "choose", "press", "tap", "hit",
-                # Input
-                "type", "enter", "input", "fill", "write", "paste",
-                # Configuration
-                "configure", "set", "enable", "disable", "change", "modify",
-                "adjust", "update", "edit",
-                # Creation
-                "create", "add", "insert", "make", "build", "generate",
-                # Management
-                "delete", "remove", "clear", "reset", "restore", "save",
-                # Verification
-                "verify", "check", "confirm", "validate", "review", "test"
-            ]
+            object.__setattr__(self, "action_verbs", list(DEFAULT_ACTION_VERBS))
 
         if self.sequence_indicators is None:
-            self.sequence_indicators = [
-                "first", "second", "third", "next", "then", "after", "finally",
-                "step", "now", "let's", "we'll", "going to"
-            ]
+            object.__setattr__(self, "sequence_indicators", list(DEFAULT_SEQUENCE_INDICATORS))
 
         # Validate weights
         total_weight = self.weight_procedural + self.weight_action_density + self.weight_coherence
@@ -109,6 +113,14 @@ class TopicRanker:
             config: Ranking configuration (uses defaults if None)
         """
         self.config = config or RankingConfig()
+
+        # Segments precompute counts for the default vocabulary; only a
+        # custom vocabulary needs a text scan at ranking time.
+        self._uses_default_vocabulary = (
+            set(self.config.action_verbs) == set(DEFAULT_ACTION_VERBS) and
+            set(self.config.sequence_indicators) == set(DEFAULT_SEQUENCE_INDICATORS)
+        )
+
         logger.info(
             f"Topic Ranker initialized: "
             f"weights=[procedural={self.config.weight_procedural}, "
@@ -126,46 +138,61 @@ class TopicRanker:
         Returns:
             List of topic scores (one per segment)
         """
-        if not segments:
-            return []
+        return list(self.iter_scores(segments))
 
-        scores = []
+    def iter_scores(self, segments: Iterable[TopicSegment]) -> Iterator[TopicScore]:
+        """
+        Lazily score segments one at a time.
+
+        Use instead of score_segments() when only a running check or the
+        top-k is needed, so scores never have to be held all at once.
+
+        Args:
+            segments: Topic segments from Phase 1 segmenter
 
+        Yields:
+            Topic score for each segment, in input order
+        """
         for segment in segments:
-            # Compute individual scores
-            procedural_score = self._compute_procedural_score(segment)
-            action_density = self._compute_action_density(segment)
-            coherence_score = segment.coherence_score if hasattr(segment, 'coherence_score') else 0.0
-
-            # Weighted combination
-            weighted_procedural = procedural_score * self.config.weight_procedural
-            weighted_action_density = action_density * self.config.weight_action_density
-            weighted_coherence = coherence_score * self.config.weight_coherence
-
-            importance_score = weighted_procedural + weighted_action_density + weighted_coherence
-
-            topic_score = TopicScore(
-                segment_index=segment.segment_index,
-                importance_score=importance_score,
-                procedural_score=procedural_score,
-                action_density=action_density,
-                coherence_score=coherence_score,
-                weighted_procedural=weighted_procedural,
-                weighted_action_density=weighted_action_density,
-                weighted_coherence=weighted_coherence
-            )
+            yield self._score_one(segment)
 
-            scores.append(topic_score)
+    def _score_one(self, segment: TopicSegment) -> TopicScore:
+        """
+        Score a single segment by importance.
 
-            logger.debug(
-                f"Segment {segment.segment_index}: "
-                f"importance={importance_score:.2f} "
-                f"(procedural={procedural_score:.2f}, "
-                f"action_density={action_density:.2f}, "
-                f"coherence={coherence_score:.2f})"
-            )
+        Args:
+            segment: Topic segment
 
-        return scores
+        Returns:
+            Topic score for the segment
+        """
+        # Compute individual scores
+        procedural_score = self._compute_procedural_score(segment)
+        action_density = self._compute_action_density(segment)
+        coherence_score = segment.coherence_score
+
+        # Weighted combination
+        importance_score = (
+            procedural_score * self.config.weight_procedural +
+            action_density * self.config.weight_action_density +
+            coherence_score * self.config.weight_coherence
+        )
+
+        logger.debug(
+            f"Segment {segment.segment_index}: "
+            f"importance={importance_score:.2f} "
+            f"(procedural={procedural_score:.2f}, "
+            f"action_density={action_density:.2f}, "
+            f"coherence={coherence_score:.2f})"
+        )
+
+        return TopicScore(
+            segment_index=segment.segment_index,
+            importance_score=importance_score,
+            procedural_score=procedural_score,
+            action_density=action_density,
+            coherence_score=coherence_score
+        )
 
     def rank_by_importance(
         self,
@@ -184,21 +211,18 @@ class TopicRanker:
             return []
 
         # Score all segments
-        scores = self.score_segments(segments)
-
-        # Create segment-score pairs
-        segment_scores = list(zip(segments, scores))
+        importances = list(map(_get_importance, self.iter_scores(segments)))
 
-        # Sort by importance (descending)
-        segment_scores.sort(key=lambda x: x[1].importance_score, reverse=True)
+        # Sort indices by importance (descending); C-level key, stable on ties
+        order = sorted(range(len(segments)), key=importances.__getitem__, reverse=True)
 
         # Extract ranked segments
-        ranked_segments = [seg for seg, score in segment_scores]
+        ranked_segments = [segments[i] for i in order]
 
         logger.info(
             f"Ranked {len(segments)} segments: "
-            f"top score={scores[0].importance_score:.2f}, "
-            f"bottom score={scores[-1].importance_score:.2f}"
+            f"top score={importances[order[0]]:.2f}, "
+            f"bottom score={importances[order[-1]]:.2f}"
         )
 
         return ranked_segments
@@ -223,25 +247,27 @@ class TopicRanker:
 
         threshold = threshold or self.config.min_importance_threshold
 
-        # Score all segments
-        scores = self.score_segments(segments)
-
-        # Filter by threshold
+        # Score and filter in a single streaming pass
         filtered = []
-        for segment, score in zip(segments, scores):
+        filtered_importances = []
+        for segment, score in zip(segments, self.iter_scores(segments)):
             if score.importance_score >= threshold:
                 filtered.append(segment)
+                filtered_importances.append(score.importance_score)
             else:
                 logger.info(
                     f"Filtering low-importance segment {segment.segment_index}: "
                     f"score={score.importance_score:.2f} < {threshold:.2f}"
                 )
 
-        # Optionally keep only top N
+        # Optionally keep only top N (highest importance first)
         if self.config.keep_top_n is not None and len(filtered) > self.config.keep_top_n:
-            # Re-rank filtered segments
-            ranked = self.rank_by_importance(filtered)
-            filtered = ranked[:self.config.keep_top_n]
+            top = heapq.nlargest(
+                self.config.keep_top_n,
+                range(len(filtered)),
+                key=filtered_importances.__getitem__
+            )
+            filtered = [filtered[i] for i in top]
             logger.info(f"Keeping top {self.config.keep_top_n} segments")
 
         logger.info(
@@ -269,25 +295,7 @@ class TopicRanker:
         if not segment.sentences:
             return 0.0
 
-        # Get all text
-        text = " ".join(s.text.lower() for s in segment.sentences)
-        words = text.split()
-
-        if not words:
-            return 0.0
-
-        # Count action verbs
-        action_count = sum(1 for verb in self.config.action_verbs if verb in text)
-
-        # Count sequence indicators
-        sequence_count = sum(1 for indicator in self.config.sequence_indicators if indicator in text)
-
-        # Count imperative sentences (start with action verb)
-        imperative_count = 0
-        for sentence in segment.sentences:
-            first_words = sentence.text.lower().split()[:2]  # First 2 words
-            if any(verb in first_words for verb in self.config.action_verbs):
-                imperative_count += 1
+        action_count, sequence_count, imperative_count = self._procedural_counts(segment)
 
         # Normalize scores
         action_score = min(1.0, action_count / (len(segment.sentences) * 2))  # Expect ~2 actions/sentence
@@ -319,8 +327,7 @@ class TopicRanker:
             return 0.0
 
         # Count action verbs in segment
-        text = " ".join(s.text.lower() for s in segment.sentences)
-        action_count = sum(1 for verb in self.config.action_verbs if verb in text)
+        action_count = self._procedural_counts(segment)[0]
 
         # Compute density
         density = action_count / len(segment.sentences)
@@ -330,6 +337,28 @@ class TopicRanker:
 
         return normalized
 
+    def _procedural_counts(self, segment: TopicSegment) -> Tuple[int, int, int]:
+        """
+        Get (action_verb_count, sequence_count, imperative_count) for a segment.
+
+        Uses the counts precomputed by TopicSegment when the config uses the
+        default vocabulary; otherwise scans the segment text.
+
+        Args:
+            segment: Topic segment
+
+        Returns:
+            Tuple of procedural indicator counts
+        """
+        if self._uses_default_vocabulary:
+            return segment.action_verb_count, segment.sequence_count, segment.imperative_count
+
+        return count_procedural_indicators(
+            segment.sentences,
+            self.config.action_verbs,
+            self.config.sequence_indicators
+        )
+
     def get_ranking_report(
         self,
         segments: List[TopicSegment]
@@ -352,7 +381,13 @@ class TopicRanker:
                 "statistics": {}
             }
 
-        importance_scores = [s.importance_score for s in scores]
+        importance_scores = np.fromiter(map(_get_importance, scores), dtype=float, count=len(scores))
+
+        # Bucket into low (<0.3), medium (0.3-0.7), high (>=0.7) in one pass
+        low_count, medium_count, high_count = np.bincount(
+            np.digitize(importance_scores, IMPORTANCE_BUCKET_EDGES),
+            minlength=3
+        ).tolist()
 
         return {
             "total_segments": len(segments),
@@ -367,20 +402,12 @@ class TopicRanker:
                 for s in scores
             ],
             "statistics": {
-                "avg_importance": sum(importance_scores) / len(importance_scores),
-                "max_importance": max(importance_scores),
-                "min_importance": min(importance_scores),
-                "std_importance": self._compute_std(importance_scores),
-                "high_importance_count": sum(1 for s in importance_scores if s >= 0.7),
-                "medium_importance_count": sum(1 for s in importance_scores if 0.3 <= s < 0.7),
-                "low_importance_count": sum(1 for s in importance_scores if s < 0.3)
+                "avg_importance": float(importance_scores.mean()),
+                "max_importance": float(importance_scores.max()),
+                "min_importance": float(importance_scores.min()),
+                "std_importance": float(importance_scores.std()),
+                "high_importance_count": high_count,
+                "medium_importance_count": medium_count,
+                "low_importance_count": low_count
             }
         }
-
-    def _compute_std(self, values: List[float]) -> float:
-        """Compute standard deviation."""
-        if not values:
-            return 0.0
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance ** 0.5
@@ -3,17 +3,232 @@ Topic segmentation module for intelligent conversation analysis.
 Groups parsed sentences into coherent topics using multi-signal boundary detection.
 """
 
+import importlib.util
 import logging
-from typing import List, Tuple, Optional
+import re
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple, Optional
 from dataclasses import dataclass, field
-from collections import Counter
+
+import numpy as np
 
 from .transcript_parser import ParsedSentence, TranscriptMetadata
 
+# Optional JIT for the O(n²) coherence kernel (numba is imported on first use)
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Default procedural vocabulary (shared with Phase 2 TopicRanker).
+# Segments count these once at construction so ranking never re-scans text.
+DEFAULT_ACTION_VERBS: Tuple[str, ...] = (
+    # Navigation
+    "navigate", "go", "open", "access", "visit", "browse",
+    # Interaction
+    "click", "select", "choose", "press", "tap", "hit",
+    # Input
+    "type", "enter", "input", "fill", "write", "paste",
+    # Configuration
+    "configure", "set", "enable", "disable", "change", "modify",
+    "adjust", "update", "edit",
+    # Creation
+    "create", "add", "insert", "make", "build", "generate",
+    # Management
+    "delete", "remove", "clear", "reset", "restore", "save",
+    # Verification
+    "verify", "check", "confirm", "validate", "review", "test"
+)
+
+DEFAULT_SEQUENCE_INDICATORS: Tuple[str, ...] = (
+    "first", "second", "third", "next", "then", "after", "finally",
+    "step", "now", "let's", "we'll", "going to"
+)
+
+
+def count_procedural_indicators(
+    sentences: List[ParsedSentence],
+    action_verbs: Iterable[str] = DEFAULT_ACTION_VERBS,
+    sequence_indicators: Iterable[str] = DEFAULT_SEQUENCE_INDICATORS
+) -> Tuple[int, int, int]:
+    """
+    Count procedural indicators in a list of sentences.
+
+    Args:
+        sentences: Sentences to scan
+        action_verbs: Action verb vocabulary
+        sequence_indicators: Sequence indicator vocabulary
+
+    Returns:
+        Tuple of (action_verb_count, sequence_count, imperative_count):
+        distinct action verbs present, distinct sequence indicators present,
+        and sentences whose first two words contain an action verb.
+    """
+    if not sentences:
+        return 0, 0, 0
+
+    text = " ".join(s.text.lower() for s in sentences)
+    action_count = sum(1 for verb in action_verbs if verb in text)
+    sequence_count = sum(1 for indicator in sequence_indicators if indicator in text)
+
+    verb_set = frozenset(action_verbs)
+    imperative_count = sum(
+        1 for s in sentences
+        if not verb_set.isdisjoint(s.text.lower().split()[:2])  # First 2 words
+    )
+
+    return action_count, sequence_count, imperative_count
+
+
+def _mean_pairwise_jaccard(offsets: np.ndarray, tokens: np.ndarray) -> float:
+    """
+    Mean Jaccard similarity over all pairs of non-empty token sets.
+
+    Sets are stored CSR-style: tokens[offsets[i]:offsets[i + 1]] holds the
+    sorted unique token ids of set i. Intersections use a sorted merge, so
+    no Python set objects are involved.
+
+    Args:
+        offsets: int64 array of length n + 1
+        tokens: int32 array of sorted unique token ids per set
+
+    Returns:
+        Mean similarity, or -1.0 if no pair had two non-empty sets
+    """
+    n = offsets.shape[0] - 1
+    total = 0.0
+    count = 0
+    for i in range(n):
+        a_start, a_end = offsets[i], offsets[i + 1]
+        if a_start == a_end:
+            continue
+        for j in range(i + 1, n):
+            b_start, b_end = offsets[j], offsets[j + 1]
+            if b_start == b_end:
+                continue
+
+            # Sorted merge to count the intersection
+            p, q, intersection = a_start, b_start, 0
+            while p < a_end and q < b_end:
+                if tokens[p] == tokens[q]:
+                    intersection += 1
+                    p += 1
+                    q += 1
+                elif tokens[p] < tokens[q]:
+                    p += 1
+                else:
+                    q += 1
+
+            union = (a_end - a_start) + (b_end - b_start) - intersection
+            total += intersection / union
+            count += 1
+
+    if count == 0:
+        return -1.0
+    return total / count
+
+
+@lru_cache(maxsize=None)
+def _jaccard_kernel():
+    """
+    _mean_pairwise_jaccard, JIT-compiled when numba is installed.
+
+    numba is imported and the kernel compiled on the first call, so importing
+    this module stays cheap for processes that never score coherence.
+    cache=True reuses the compiled kernel across runs.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _mean_pairwise_jaccard
+    return njit(cache=True)(_mean_pairwise_jaccard)
+
+
+# MinHash coherence estimate for long segments (fixed seeds: deterministic across runs)
+_MINHASH_LANES = 64
+# Segments up to this size get exact coherence; fixed so numba only changes speed,
+# never scores (exact pairs cost ~10 ms in pure Python at this size)
+DEFAULT_EXACT_COHERENCE_MAX_SENTENCES = 256
+_MINHASH_SEEDS = np.random.default_rng(0x5C2D0C).integers(
+    0, np.iinfo(np.uint64).max, size=_MINHASH_LANES, dtype=np.uint64, endpoint=True
+)
+
+
+def _fmix64(x: np.ndarray) -> np.ndarray:
+    """MurmurHash3 64-bit finalizer (a bijection on uint64), applied elementwise."""
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xFF51AFD7ED558CCD)
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xC4CEB9FE1A85EC53)
+    return x ^ (x >> np.uint64(33))
+
+
+def _minhash_mean_jaccard(offsets: np.ndarray, tokens: np.ndarray) -> float:
+    """
+    MinHash estimate of _mean_pairwise_jaccard, linear in the number of sets.
+
+    Each lane's collision probability for a pair equals its Jaccard
+    similarity, so the mean over pairs is the number of colliding pairs per
+    lane divided by the number of pairs. Colliding pairs are counted by
+    sorting each lane instead of comparing signatures pairwise.
+
+    Args:
+        offsets: int64 array of length n + 1 (CSR layout, see _mean_pairwise_jaccard)
+        tokens: int32 array of token ids per set
+
+    Returns:
+        Estimated mean similarity, or -1.0 if fewer than two sets are non-empty
+    """
+    starts = offsets[:-1][offsets[1:] > offsets[:-1]]
+    m = starts.shape[0]
+    if m < 2:
+        return -1.0
+
+    # Signatures: per lane, the minimum seeded hash over each set's tokens
+    hashed = _fmix64(tokens.astype(np.uint64)[np.newaxis, :] ^ _MINHASH_SEEDS[:, np.newaxis])
+    signatures = np.sort(np.minimum.reduceat(hashed, starts, axis=1), axis=1)
+
+    # Colliding pairs: each element pairs with the earlier elements of its run
+    positions = np.arange(m)
+    run_start = np.ones(signatures.shape, dtype=bool)
+    run_start[:, 1:] = signatures[:, 1:] != signatures[:, :-1]
+    first_in_run = np.maximum.accumulate(np.where(run_start, positions, 0), axis=1)
+    colliding_pairs = int((positions - first_in_run).sum())
+
+    return colliding_pairs / (_MINHASH_LANES * (m * (m - 1) // 2))
+
+
+# Keyword extraction (boundary similarity and segment coherence)
+_STOPWORDS: FrozenSet[str] = frozenset({
+    'the', 'and', 'for', 'with', 'this', 'that', 'from', 'will', 'have', 'your'
+})
+_MIN_KEYWORD_LEN = 4
+# Runs of at least _MIN_KEYWORD_LEN letters; length and punctuation are filtered by the regex engine
+_KEYWORD_RE = re.compile(rf"[a-z]{{{_MIN_KEYWORD_LEN},}}")
+
+# Bounded: the worker is long-lived and sees many distinct transcripts
+_KEYWORD_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=_KEYWORD_CACHE_SIZE)
+def _keywords_for(text: str) -> FrozenSet[str]:
+    """
+    Extract keywords from sentence text (cached per distinct text).
+
+    Simple approach: lowercased runs of 4+ letters, minus common words.
+    Punctuation is not part of a keyword, so "settings," matches "settings".
+    Boundary scoring and coherence both reuse the same cached frozenset.
+
+    Args:
+        text: Sentence text
+
+    Returns:
+        Frozen set of keywords
+    """
+    return frozenset(w for w in _KEYWORD_RE.findall(text.lower()) if w not in _STOPWORDS)
+
+
+@dataclass(slots=True)
 class SegmentationConfig:
     """Configuration for topic segmentation behavior and thresholds."""
 
@@ -31,10 +246,12 @@ class SegmentationConfig:
     min_segment_sentences: int = 2           # Merge segments shorter than this
     max_segment_sentences: int = 30          # Split segments longer than this (optional)
     min_total_segments: int = 3              # ⭐ CRITICAL: Minimum segments for any transcript (prevents 1-step documents)
+    exact_coherence_max_sentences: int = DEFAULT_EXACT_COHERENCE_MAX_SENTENCES  # Larger segments use a MinHash estimate
 
     # Feature toggles
     use_semantic_similarity: bool = False    # Enable keyword-based similarity
     merge_small_segments: bool = True        # Automatically merge small segments
+    compute_coherence: bool = False          # Score segment coherence (needed by topic ranking)
 
     def __post_init__(self):
         """Validate configuration."""
@@ -51,7 +268,7 @@ class SegmentationConfig:
             raise ValueError(f"boundary_score_threshold must be 0.0-1.0, got {self.boundary_score_threshold}")
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicSegment:
     """A coherent topic segment containing related sentences."""
 
@@ -78,37 +295,98 @@ class TopicSegment:
     coherence_score: float = 0.0            # Semantic coherence (0.0-1.0)
     fallback_split: bool = False            # ⭐ Created by minimum count fallback (not natural boundary)
 
+    # Procedural indicator counts (default vocabulary, read by TopicRanker)
+    action_verb_count: int = 0              # Distinct action verbs present
+    sequence_count: int = 0                 # Distinct sequence indicators present
+    imperative_count: int = 0               # Sentences starting with an action verb
+
+    # Cached concatenated text (see `text`); cleared by recompute_metadata()
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Compute derived metadata from sentences."""
+        if self.sentences:
+            self.recompute_metadata()
+
+    def recompute_metadata(self) -> None:
+        """
+        (Re)compute derived metadata from the current sentences.
+
+        Call after changing `sentences` in place (e.g. when merging segments)
+        instead of constructing a new TopicSegment.
+        """
+        # Reset derived fields so a shrunk or emptied segment has no stale values
+        self._text = None
+        self.start_timestamp = None
+        self.end_timestamp = None
+        self.duration_seconds = None
+        self.primary_speaker = None
+        self.speaker_counts = {}
+        self.has_transition_start = False
+        self.has_qa_section = False
+        self.question_count = 0
+        self.action_verb_count = 0
+        self.sequence_count = 0
+        self.imperative_count = 0
+
         if not self.sentences:
             return
 
-        # Extract timestamps
-        timestamps = [s.timestamp for s in self.sentences if s.timestamp is not None]
-        if timestamps:
-            self.start_timestamp = min(timestamps)
-            self.end_timestamp = max(timestamps)
-            self.duration_seconds = self.end_timestamp - self.start_timestamp
-
-        # Count speakers
-        speaker_counter = Counter(s.speaker for s in self.sentences if s.speaker)
-        self.speaker_counts = dict(speaker_counter)
-        if speaker_counter:
-            self.primary_speaker = speaker_counter.most_common(1)[0][0]
+        # Single pass over sentences: timestamps, speakers, questions, Q&A
+        min_ts = max_ts = None
+        speaker_counts = {}
+        question_count = 0
+        has_qa = False
+        for s in self.sentences:
+            if s.timestamp is not None:
+                if min_ts is None or s.timestamp < min_ts:
+                    min_ts = s.timestamp
+                if max_ts is None or s.timestamp > max_ts:
+                    max_ts = s.timestamp
+            if s.speaker:
+                speaker_counts[s.speaker] = speaker_counts.get(s.speaker, 0) + 1
+            if s.is_question:
+                question_count += 1
+                # Q&A sections: questions from participants
+                if s.speaker_role == "participant":
+                    has_qa = True
+
+        if min_ts is not None:
+            self.start_timestamp = min_ts
+            self.end_timestamp = max_ts
+            self.duration_seconds = max_ts - min_ts
+
+        self.speaker_counts = speaker_counts
+        if speaker_counts:
+            # Argmax over insertion order; ties go to the first speaker seen
+            self.primary_speaker = max(speaker_counts, key=speaker_counts.get)
 
         # Detect characteristics
-        self.has_transition_start = self.sentences[0].is_transition if self.sentences else False
-        self.question_count = sum(1 for s in self.sentences if s.is_question)
+        self.has_transition_start = self.sentences[0].is_transition
+        self.question_count = question_count
+        self.has_qa_section = has_qa
+
+        # Procedural indicators (counted once here instead of per ranking pass)
+        (
+            self.action_verb_count,
+            self.sequence_count,
+            self.imperative_count
+        ) = count_procedural_indicators(self.sentences)
+
+    @property
+    def text(self) -> str:
+        """
+        Concatenated text of all sentences in segment (built once, then cached).
 
-        # Detect Q&A sections (questions from participants)
-        self.has_qa_section = any(
-            s.is_question and s.speaker_role == "participant"
-            for s in self.sentences
-        )
+        Call recompute_metadata() after changing `sentences` in place.
+        """
+        if self._text is None:
+            self._text = ' '.join(s.text for s in self.sentences)
+        return self._text
 
     def get_text(self) -> str:
         """Get concatenated text of all sentences in segment."""
-        return ' '.join(s.text for s in self.sentences)
+        return self.text
 
     def __str__(self) -> str:
         """String representation for debugging."""
@@ -129,6 +407,67 @@ class TopicSegment:
         return " | ".join(parts)
 
 
+# Small-integer speaker role codes used by SentenceArrays
+ROLE_UNKNOWN, ROLE_INSTRUCTOR, ROLE_PARTICIPANT = 0, 1, 2
+_ROLE_CODES = {"instructor": ROLE_INSTRUCTOR, "participant": ROLE_PARTICIPANT}
+
+
+@dataclass(slots=True)
+class SentenceArrays:
+    """Per-sentence boundary signals as NumPy arrays (one element per sentence)."""
+    timestamps: np.ndarray  # float, NaN where the sentence has no timestamp
+    is_transition: np.ndarray  # bool
+    follows_long_pause: np.ndarray  # bool
+    speaker_changed: np.ndarray  # bool
+    speaker_id: np.ndarray  # int32 factorized speaker, -1 where no speaker
+    speaker_role: np.ndarray  # int8 ROLE_* code
+
+    @classmethod
+    def from_sentences(cls, sentences: List[ParsedSentence]) -> "SentenceArrays":
+        """
+        Build the arrays with one pass of attribute access per field.
+
+        Args:
+            sentences: List of parsed sentences
+
+        Returns:
+            SentenceArrays aligned with sentences
+        """
+        n = len(sentences)
+        speaker_codes = {}
+        speaker_id = np.fromiter(
+            (speaker_codes.setdefault(s.speaker, len(speaker_codes)) if s.speaker else -1 for s in sentences),
+            dtype=np.int32,
+            count=n
+        )
+        return cls(
+            timestamps=np.array(
+                [np.nan if s.timestamp is None else s.timestamp for s in sentences],
+                dtype=float
+            ),
+            is_transition=np.fromiter((s.is_transition for s in sentences), dtype=bool, count=n),
+            follows_long_pause=np.fromiter((s.follows_long_pause for s in sentences), dtype=bool, count=n),
+            speaker_changed=np.fromiter((s.speaker_changed for s in sentences), dtype=bool, count=n),
+            speaker_id=speaker_id,
+            speaker_role=np.fromiter(
+                (_ROLE_CODES.get(s.speaker_role, ROLE_UNKNOWN) for s in sentences),
+                dtype=np.int8,
+                count=n
+            ),
+        )
+
+    @property
+    def has_speaker(self) -> np.ndarray:
+        """Whether each sentence has a (non-empty) speaker."""
+        return self.speaker_id >= 0
+
+    @property
+    def pause_override(self) -> np.ndarray:
+        """Long pause with a (truthy) timestamp, per sentence (see _is_topic_boundary)."""
+        has_timestamp = ~np.isnan(self.timestamps) & (self.timestamps != 0)
+        return self.follows_long_pause & has_timestamp
+
+
 class TopicSegmenter:
     """
     Segment parsed transcript into coherent topics using multi-signal boundary detection.
@@ -165,7 +504,7 @@ class TopicSegmenter:
         1. Compute boundary scores between consecutive sentences
         2. Create segments at boundaries
         3. Merge small segments (if enabled)
-        4. Compute segment metadata
+        4. Compute segment quality metrics (if enabled)
 
         Args:
             parsed_sentences: List of parsed sentences with metadata
@@ -180,8 +519,15 @@ class TopicSegmenter:
 
         logger.info(f"Segmenting {len(parsed_sentences)} sentences into topics...")
 
+        # Per-sentence inputs shared by boundary scoring and segment metrics
+        arrays = SentenceArrays.from_sentences(parsed_sentences)
+        keywords = (
+            [_keywords_for(s.text) for s in parsed_sentences]
+            if self.config.compute_coherence else None
+        )
+
         # Step 1: Identify topic boundaries
-        boundary_indices = self._identify_boundaries(parsed_sentences)
+        boundary_indices = self._identify_boundaries(parsed_sentences, arrays, keywords)
         logger.info(f"Identified {len(boundary_indices)} topic boundaries")
 
         # Step 2: Create segments from boundaries
@@ -202,8 +548,9 @@ class TopicSegmenter:
             segments = self._ensure_minimum_segments(segments, parsed_sentences)
             logger.info(f"After minimum enforcement: {len(segments)} segments")
 
-        # Step 4: Compute segment quality metrics
-        segments = self._compute_segment_metrics(segments)
+        # Step 4: Compute segment quality metrics (coherence stays 0.0 otherwise)
+        if self.config.compute_coherence:
+            segments = self._compute_segment_metrics(segments, keywords)
 
         logger.info(f"Segmentation complete: {len(segments)} topics")
         for seg in segments:
@@ -211,34 +558,171 @@ class TopicSegmenter:
 
         return segments
 
-    def _identify_boundaries(self, sentences: List[ParsedSentence]) -> List[int]:
+    def _identify_boundaries(
+        self,
+        sentences: List[ParsedSentence],
+        arrays: Optional[SentenceArrays] = None,
+        keywords: Optional[List[FrozenSet[str]]] = None
+    ) -> List[int]:
         """
         Identify topic boundary indices using multi-signal analysis.
 
         Args:
             sentences: List of parsed sentences
+            arrays: Precomputed SentenceArrays for sentences (built if None)
+            keywords: Precomputed keywords per sentence (extracted if None)
 
         Returns:
             List of sentence indices that start new topics
         """
-        boundaries = [0]  # First sentence always starts a topic
-
-        for i in range(1, len(sentences)):
-            prev_sent = sentences[i - 1]
-            curr_sent = sentences[i]
+        if len(sentences) < 2:
+            return [0]  # First sentence always starts a topic
+
+        if arrays is None:
+            arrays = SentenceArrays.from_sentences(sentences)
+
+        scores = self._compute_boundary_scores(sentences, arrays, keywords)
+
+        # Vectorized _is_topic_boundary over all consecutive pairs
+        # Override 1: long pause with a (truthy) timestamp
+        # Override 2: transition phrase with a near-threshold score
+        curr = slice(1, None)
+        is_boundary = self._boundary_mask(
+            scores,
+            arrays.is_transition[curr],
+            arrays.pause_override[curr]
+        )
 
-            # Compute boundary score
-            boundary_score = self._compute_boundary_score(prev_sent, curr_sent)
+        # Sentence i starts a topic if i == 0 or pair (i - 1, i) is a boundary
+        starts_topic = np.empty(len(sentences), dtype=bool)
+        starts_topic[0] = True  # First sentence always starts a topic
+        starts_topic[1:] = is_boundary
+        boundary_indices = np.flatnonzero(starts_topic).tolist()
 
-            # Check if boundary
-            if self._is_topic_boundary(boundary_score, curr_sent):
-                boundaries.append(i)
+        if logger.isEnabledFor(logging.DEBUG):
+            for i in boundary_indices[1:]:
                 logger.debug(
-                    f"Boundary at sentence {i}: score={boundary_score:.2f} "
-                    f"text='{curr_sent.text[:50]}...'"
+                    f"Boundary at sentence {i}: score={scores[i - 1]:.2f} "
+                    f"text='{sentences[i].text[:50]}...'"
+                )
+
+        return boundary_indices
+
+    def _boundary_mask(
+        self,
+        scores: np.ndarray,
+        is_transition: np.ndarray,
+        pause_override: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized _is_topic_boundary over arrays of consecutive pairs.
+
+        Args:
+            scores: Boundary scores per pair
+            is_transition: Whether each pair's current sentence is a transition
+            pause_override: Long pause with a (truthy) timestamp per pair
+
+        Returns:
+            Boolean array, True where the pair is a topic boundary
+        """
+        return (
+            (scores > self.config.boundary_score_threshold) |
+            pause_override |
+            (is_transition & (scores >= 0.30))
+        )
+
+    def _compute_boundary_scores(
+        self,
+        sentences: List[ParsedSentence],
+        arrays: Optional[SentenceArrays] = None,
+        keywords: Optional[List[FrozenSet[str]]] = None
+    ) -> np.ndarray:
+        """
+        Compute boundary scores for every consecutive sentence pair at once.
+
+        Vectorized equivalent of calling _compute_boundary_score(sentences[i - 1],
+        sentences[i]) for i in 1..N-1; element i - 1 holds the score for pair i.
+        Like the scalar version, the semantic signal is skipped (leaving a lower
+        bound) for pairs whose boundary decision it cannot change.
+
+        Args:
+            sentences: List of parsed sentences (at least 2)
+            arrays: Precomputed SentenceArrays for sentences (built if None)
+            keywords: Precomputed keywords per sentence (extracted if None)
+
+        Returns:
+            Array of N-1 boundary scores (0.0-1.0)
+        """
+        if arrays is None:
+            arrays = SentenceArrays.from_sentences(sentences)
+
+        prev, curr = slice(None, -1), slice(1, None)
+        timestamps = arrays.timestamps
+        is_transition = arrays.is_transition
+        follows_long_pause = arrays.follows_long_pause
+        speaker_changed = arrays.speaker_changed
+        has_speaker = arrays.has_speaker
+        roles = arrays.speaker_role
+
+        # Signal 1: Timestamp gap (0.0 when either timestamp is missing)
+        missing_timestamp = np.isnan(timestamps[prev]) | np.isnan(timestamps[curr])
+        with np.errstate(invalid="ignore"):
+            gap_score = np.minimum(
+                (timestamps[curr] - timestamps[prev]) / self.config.timestamp_gap_threshold,
+                1.0
+            )
+        gap_score = np.where(follows_long_pause[curr], 1.0, gap_score)
+        gap_score = np.where(missing_timestamp, 0.0, gap_score)
+
+        # Signal 2: Speaker transition (only on an actual change between known speakers)
+        instructor_resumes = (roles[prev] == ROLE_PARTICIPANT) & (roles[curr] == ROLE_INSTRUCTOR)
+        speaker_score = np.where(
+            instructor_resumes,
+            1.0,
+            np.where(is_transition[curr], 0.8, 0.3)
+        )
+        speaker_score = np.where(
+            has_speaker[prev] & has_speaker[curr] & speaker_changed[curr],
+            speaker_score,
+            0.0
+        )
+
+        # Signal 3: Transition phrase
+        transition_score = is_transition[curr].astype(float)
+
+        # Same summation order as _compute_boundary_score (bit-identical results)
+        scores = self.config.weight_timestamp_gap * gap_score
+        scores = scores + self.config.weight_speaker_transition * speaker_score
+        scores = scores + self.config.weight_transition_phrase * transition_score
+
+        # Signal 4: Semantic similarity (optional, most expensive)
+        # Only computed for pairs where the full semantic weight could flip the decision
+        if self.config.use_semantic_similarity:
+            pause_override = arrays.pause_override[curr]
+            undecided = np.flatnonzero(
+                self._boundary_mask(np.minimum(scores, 1.0), is_transition[curr], pause_override) !=
+                self._boundary_mask(
+                    np.minimum(scores + self.config.weight_semantic_similarity, 1.0),
+                    is_transition[curr],
+                    pause_override
                 )
+            )
+            semantic_score = np.fromiter(
+                (
+                    self._compute_semantic_similarity_score(
+                        sentences[i],
+                        sentences[i + 1],
+                        None if keywords is None else keywords[i],
+                        None if keywords is None else keywords[i + 1]
+                    )
+                    for i in undecided.tolist()
+                ),
+                dtype=float,
+                count=len(undecided)
+            )
+            scores[undecided] = scores[undecided] + self.config.weight_semantic_similarity * semantic_score
 
-        return boundaries
+        return np.minimum(scores, 1.0)  # Cap at 1.0
 
     def _compute_boundary_score(
         self,
@@ -254,7 +738,9 @@ class TopicSegmenter:
             curr_sent: Current sentence
 
         Returns:
-            Boundary score (0.0-1.0)
+            Boundary score (0.0-1.0). If the semantic signal was skipped
+            because it could not change the boundary decision, this is a
+            lower bound of the full score.
         """
         score = 0.0
 
@@ -270,10 +756,13 @@ class TopicSegmenter:
         transition_score = self._compute_transition_phrase_score(curr_sent)
         score += self.config.weight_transition_phrase * transition_score
 
-        # Signal 4: Semantic similarity (optional)
+        # Signal 4: Semantic similarity (optional, most expensive)
+        # Skipped when even the full semantic weight cannot change the decision
         if self.config.use_semantic_similarity:
-            semantic_score = self._compute_semantic_similarity_score(prev_sent, curr_sent)
-            score += self.config.weight_semantic_similarity * semantic_score
+            best_case = min(score + self.config.weight_semantic_similarity, 1.0)
+            if self._is_topic_boundary(min(score, 1.0), curr_sent) != self._is_topic_boundary(best_case, curr_sent):
+                semantic_score = self._compute_semantic_similarity_score(prev_sent, curr_sent)
+                score += self.config.weight_semantic_similarity * semantic_score
 
         return min(score, 1.0)  # Cap at 1.0
 
@@ -359,7 +848,9 @@ class TopicSegmenter:
     def _compute_semantic_similarity_score(
         self,
         prev_sent: ParsedSentence,
-        curr_sent: ParsedSentence
+        curr_sent: ParsedSentence,
+        prev_keywords: Optional[FrozenSet[str]] = None,
+        curr_keywords: Optional[FrozenSet[str]] = None
     ) -> float:
         """
         Compute score based on semantic similarity (keyword overlap).
@@ -368,19 +859,16 @@ class TopicSegmenter:
         Args:
             prev_sent: Previous sentence
             curr_sent: Current sentence
+            prev_keywords: Precomputed keywords of prev_sent (extracted if None)
+            curr_keywords: Precomputed keywords of curr_sent (extracted if None)
 
         Returns:
             Score 0.0-1.0 (higher = less similar = more likely boundary)
         """
-        # Extract keywords (simple approach: nouns/verbs, >3 chars, lowercased)
-        def extract_keywords(text: str) -> set:
-            words = text.lower().split()
-            # Filter: length >3, not common words
-            stopwords = {'the', 'and', 'for', 'with', 'this', 'that', 'from', 'will', 'have', 'your'}
-            return {w for w in words if len(w) > 3 and w not in stopwords}
-
-        prev_keywords = extract_keywords(prev_sent.text)
-        curr_keywords = extract_keywords(curr_sent.text)
+        if prev_keywords is None:
+            prev_keywords = _keywords_for(prev_sent.text)
+        if curr_keywords is None:
+            curr_keywords = _keywords_for(curr_sent.text)
 
         if not prev_keywords or not curr_keywords:
             return 0.5  # Neutral if no keywords
@@ -474,6 +962,7 @@ class TopicSegmenter:
             return segments
 
         merged = []
+        grown = []  # Segments that absorbed others (metadata is stale)
         i = 0
 
         while i < len(segments):
@@ -488,17 +977,12 @@ class TopicSegmenter:
                 if merged:
                     prev = merged[-1]
 
-                    # Combine sentences
-                    combined_sentences = prev.sentences + current.sentences
-
-                    # Create new merged segment
-                    merged_segment = TopicSegment(
-                        segment_index=prev.segment_index,
-                        sentences=combined_sentences
-                    )
-
-                    # Replace previous segment
-                    merged[-1] = merged_segment
+                    # Combine sentences in place (metadata recomputed once after the loop);
+                    # copy once on first growth so a caller's list is never mutated
+                    if not grown or grown[-1] is not prev:
+                        prev.sentences = list(prev.sentences)
+                        grown.append(prev)
+                    prev.sentences.extend(current.sentences)
 
                     logger.debug(
                         f"Merged small segment {current.segment_index} "
@@ -510,6 +994,9 @@ class TopicSegmenter:
 
                 i += 1
 
+        for segment in grown:
+            segment.recompute_metadata()
+
         # Re-index segments
         for idx, segment in enumerate(merged):
             segment.segment_index = idx
@@ -545,11 +1032,11 @@ class TopicSegmenter:
             f"(min requirement: {self.config.min_total_segments})"
         )
 
-        # Sort segments by size (largest first)
-        sorted_segments = sorted(segments, key=lambda s: len(s.sentences), reverse=True)
+        # Find the largest segment in one pass (first one wins on ties)
+        largest_idx = max(range(len(segments)), key=lambda i: len(segments[i].sentences))
 
         # We'll split the largest segment into (segments_needed + 1) parts
-        largest_segment = sorted_segments[0]
+        largest_segment = segments[largest_idx]
 
         # Split evenly
         sentences = largest_segment.sentences
@@ -580,13 +1067,7 @@ class TopicSegmenter:
             start_idx = end_idx
 
         # Replace largest segment with splits
-        result_segments = []
-        for seg in segments:
-            if seg.segment_index == largest_segment.segment_index:
-                # Replace with splits
-                result_segments.extend(new_segments)
-            else:
-                result_segments.append(seg)
+        result_segments = segments[:largest_idx] + new_segments + segments[largest_idx + 1:]
 
         # Re-index all segments
         for idx, segment in enumerate(result_segments):
@@ -599,7 +1080,11 @@ class TopicSegmenter:
 
         return result_segments
 
-    def _compute_segment_metrics(self, segments: List[TopicSegment]) -> List[TopicSegment]:
+    def _compute_segment_metrics(
+        self,
+        segments: List[TopicSegment],
+        keywords: Optional[List[FrozenSet[str]]] = None
+    ) -> List[TopicSegment]:
         """
         Compute quality metrics for each segment.
 
@@ -608,18 +1093,33 @@ class TopicSegmenter:
         - action_density: Actions per sentence (computed later by pipeline)
 
         Args:
-            segments: List of segments
+            segments: List of segments (contiguous, in transcript order)
+            keywords: Precomputed keywords per transcript sentence (extracted if None)
 
         Returns:
             Same segments with metrics computed
         """
+        # Segments partition the transcript in order, so each one owns the next
+        # len(segment.sentences) keyword sets
+        if keywords is not None and sum(len(seg.sentences) for seg in segments) != len(keywords):
+            keywords = None
+
+        offset = 0
         for segment in segments:
+            end = offset + len(segment.sentences)
+            segment_keywords = None if keywords is None else keywords[offset:end]
+            offset = end
+
             # Coherence: Average pairwise keyword similarity
-            segment.coherence_score = self._compute_segment_coherence(segment)
+            segment.coherence_score = self._compute_segment_coherence(segment, segment_keywords)
 
         return segments
 
-    def _compute_segment_coherence(self, segment: TopicSegment) -> float:
+    def _compute_segment_coherence(
+        self,
+        segment: TopicSegment,
+        sentence_keywords: Optional[List[FrozenSet[str]]] = None
+    ) -> float:
         """
         Compute internal coherence of a segment (0.0-1.0).
 
@@ -627,6 +1127,7 @@ class TopicSegmenter:
 
         Args:
             segment: Topic segment
+            sentence_keywords: Precomputed keywords per segment sentence (extracted if None)
 
         Returns:
             Coherence score (0.0-1.0, higher = more coherent)
@@ -635,12 +1136,26 @@ class TopicSegmenter:
             return 1.0  # Single sentence is perfectly coherent
 
         # Extract keywords for each sentence
-        def extract_keywords(text: str) -> set:
-            words = text.lower().split()
-            stopwords = {'the', 'and', 'for', 'with', 'this', 'that', 'from', 'will', 'have', 'your'}
-            return {w for w in words if len(w) > 3 and w not in stopwords}
-
-        sentence_keywords = [extract_keywords(s.text) for s in segment.sentences]
+        if sentence_keywords is None:
+            sentence_keywords = [_keywords_for(s.text) for s in segment.sentences]
+
+        use_minhash = len(sentence_keywords) > self.config.exact_coherence_max_sentences
+        if use_minhash or NUMBA_AVAILABLE:
+            # CSR-packed token ids (ids are exact, no hash collisions)
+            vocabulary = {}
+            offsets = np.zeros(len(sentence_keywords) + 1, dtype=np.int64)
+            token_ids = []
+            for i, keywords in enumerate(sentence_keywords):
+                token_ids.extend(sorted(vocabulary.setdefault(w, len(vocabulary)) for w in keywords))
+                offsets[i + 1] = len(token_ids)
+            token_ids = np.array(token_ids, dtype=np.int32)
+
+            # Long segments: linear MinHash estimate instead of O(n²) exact pairs
+            if use_minhash:
+                mean_similarity = _minhash_mean_jaccard(offsets, token_ids)
+            else:
+                mean_similarity = _jaccard_kernel()(offsets, token_ids)
+            return 0.5 if mean_similarity < 0 else float(mean_similarity)  # Neutral if no comparisons
 
         # Compute pairwise similarities
         similarities = []
@@ -3,8 +3,216 @@ Transcript cleaning and normalization module.
 Removes timestamps, filler words, speaker labels, and other noise.
 """
 
+import difflib
+import math
 import re
-from typing import List, Set
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Optional C++ edit-distance kernel for rejecting dedup pairs
+try:
+    from rapidfuzz.distance import Indel
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+# Patterns compiled once at import (re's cache lookup per call is not free)
+# HH:MM:SS with optional milliseconds, shared by every timestamp format.
+# Kept as separate passes: the bracketed ones start with a literal that re
+# scans for quickly, which one alternation starting with \d would lose
+_TIMESTAMP = r'\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?'
+_TIMESTAMP_RES = [
+    re.compile(rf'\[{_TIMESTAMP}\]'),  # [00:15:32] or [00:15:32.123]
+    re.compile(rf'\({_TIMESTAMP}\)'),  # (00:15:32)
+    re.compile(rf'<{_TIMESTAMP}>'),   # <00:15:32>
+    re.compile(rf'{_TIMESTAMP}\s*-\s*'),  # 00:15:32 -
+    re.compile(rf'^{_TIMESTAMP}\s+'),  # 00:15:32 at start of line
+]
+
+# Speaker label formats, in the order they are stripped from a line start:
+# "Speaker 1:" / "JOHN:", "[Speaker 1]:", ">> Speaker 1:", "**Speaker 1**:".
+# Fused into one optional sequence so a whole text is handled in one pass;
+# whitespace excludes "\n" so a label never reaches into the next line.
+_HSPACE = r'[^\S\n]'
+_SPEAKER_NAME = rf'(?:Speaker{_HSPACE}*\d*|[A-Z][a-z]+)'
+_SPEAKER_LABEL_RE = re.compile(
+    rf'^(?:{_SPEAKER_NAME}{_HSPACE}*:{_HSPACE}*)?'
+    rf'(?:\[{_SPEAKER_NAME}\]{_HSPACE}*:{_HSPACE}*)?'
+    rf'(?:>>{_HSPACE}*{_SPEAKER_NAME}{_HSPACE}*:{_HSPACE}*)?'
+    rf'(?:\*\*{_SPEAKER_NAME}\*\*{_HSPACE}*:{_HSPACE}*)?',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# (lowercase marker, pattern) in removal order: header, NOTE, STYLE blocks
+_WEBVTT_BLOCK_RES = [
+    ('webvtt', re.compile(r'WEBVTT\s*', re.IGNORECASE)),
+    ('note', re.compile(r'NOTE\s+[^\n]*\n', re.IGNORECASE)),
+    ('style', re.compile(r'STYLE\s+[^\n]*\n', re.IGNORECASE)),
+]
+_WEBVTT_VOICE_OPEN_RE = re.compile(r'<v\s+[^>]+>')
+
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+_MISSING_SPACE_AFTER_PUNCT_RE = re.compile(r'([.!?,;:])([A-Za-z])')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.!?,;:])')
+_REPEATED_PUNCT_RE = re.compile(r'([.!?]){2,}')
+# Cheap substring guards for the passes above
+_PUNCTUATION_MARKS = '.!?,;:'
+_REPEATED_PUNCT_PAIRS = [a + b for a in '.!?' for b in '.!?']
+
+_SENTENCE_SPLIT_RE = re.compile(r'([.!?]+)\s+(?=[A-Z])')
+
+# Near-duplicate detection on long transcripts: MinHash LSH proposes candidate
+# pairs, difflib confirms them (fixed seeds: deterministic across runs)
+_DEDUP_LSH_MIN_SENTENCES = 50    # Below this, compare every pair directly
+_DEDUP_SHINGLE_SIZE = 3          # Character shingles track edit-based similarity
+_DEDUP_LSH_BANDS = 16
+_DEDUP_LSH_ROWS = 2              # 32 hashes; pairs with Jaccard >= 0.5 are candidates ~99% of the time
+_DEDUP_SIGNATURE_BLOCK = 256     # Texts hashed together; bounds the (hashes x shingles) matrix
+_DEDUP_MINHASH_SEEDS = np.random.default_rng(0xD3D0).integers(
+    0, np.iinfo(np.uint64).max, size=_DEDUP_LSH_BANDS * _DEDUP_LSH_ROWS,
+    dtype=np.uint64, endpoint=True
+)
+
+
+def _fmix64(x: np.ndarray) -> np.ndarray:
+    """MurmurHash3 64-bit finalizer (a bijection on uint64), applied elementwise."""
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xFF51AFD7ED558CCD)
+    x = x ^ (x >> np.uint64(33))
+    x = x * np.uint64(0xC4CEB9FE1A85EC53)
+    return x ^ (x >> np.uint64(33))
+
+
+# Recently tokenized texts kept per SentenceTokenizer
+_TOKENIZE_CACHE_SIZE = 32
+
+_DEDUP_LENGTH_BAND = 8  # Kept sentences are grouped by len // _DEDUP_LENGTH_BAND
+
+
+def _length_bands(length: int, threshold: float) -> Iterable[int]:
+    """
+    Length bands that can hold a string within `threshold` difflib ratio of one of `length` chars.
+
+    ratio() <= 2 * min(la, lb) / (la + lb), so lb must lie in
+    [la * t / (2 - t), la * (2 - t) / t]. The band range is widened by one
+    character each way; real_quick_ratio() makes the exact call.
+
+    Args:
+        length: Length of the new string
+        threshold: Similarity threshold, must be positive (values above 1.0
+            probe the 1.0 bands; nothing can match them anyway)
+
+    Returns:
+        Range of band keys to probe
+    """
+    threshold = min(threshold, 1.0)
+    lo = max(0, math.floor(length * threshold / (2 - threshold)) - 1)
+    hi = math.ceil(length * (2 - threshold) / threshold) + 1
+    return range(lo // _DEDUP_LENGTH_BAND, hi // _DEDUP_LENGTH_BAND + 1)
+
+
+def _is_similar(matcher: difflib.SequenceMatcher, threshold: float) -> bool:
+    """ratio() >= threshold, checking cheap upper bounds on ratio() first."""
+    if matcher.real_quick_ratio() < threshold:
+        return False
+    if RAPIDFUZZ_AVAILABLE:
+        # difflib's matching blocks form a common subsequence, so the Indel
+        # (LCS) similarity bounds ratio() from above, tighter than quick_ratio().
+        # Compared as an integer distance, with slack so float rounding can't
+        # reject an exact tie: ratio() >= threshold implies distance <= this
+        total = len(matcher.a) + len(matcher.b)
+        max_distance = int(total * (1.0 - threshold) + 1e-6)
+        if Indel.distance(matcher.a, matcher.b, score_cutoff=max_distance) > max_distance:
+            return False
+    elif matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
+def _literal_trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex matching any of ``words``, factored into a prefix trie.
+    
+    Alternatives at each node start with distinct characters, so the regex
+    engine follows one path per position instead of trying every word; the
+    cost no longer grows with the vocabulary. Optional word endings are
+    greedy, so the longest word wins, as with a longest-first alternation.
+    
+    Args:
+        words: Literal strings to match
+        
+    Returns:
+        Pattern source (without anchors or word boundaries)
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        if len(branches) == 1:
+            body = branches[0]
+            return f'(?:{body})?' if '' in node else body
+        body = '(?:' + '|'.join(branches) + ')'
+        return body + '?' if '' in node else body
+    
+    return build(trie)
+
+
+def _compare_to(matcher: difflib.SequenceMatcher, text: str) -> difflib.SequenceMatcher:
+    """Point a kept sentence's matcher (``b`` already indexed) at a new ``a``."""
+    matcher.set_seq1(text)
+    return matcher
+
+
+def _minhash_signatures(texts: List[str]) -> np.ndarray:
+    """
+    MinHash signatures of the character shingles of each text.
+
+    Args:
+        texts: Non-empty strings
+
+    Texts are hashed _DEDUP_SIGNATURE_BLOCK at a time, so peak memory
+    depends on the block rather than the whole transcript.
+
+    Returns:
+        uint64 array of shape (len(texts), number of hashes)
+    """
+    blocks = []
+    for start in range(0, len(texts), _DEDUP_SIGNATURE_BLOCK):
+        offsets = [0]
+        shingle_hashes = []
+        for t in texts[start:start + _DEDUP_SIGNATURE_BLOCK]:
+            size = min(_DEDUP_SHINGLE_SIZE, len(t))
+            shingles = {t[i:i + size] for i in range(len(t) - size + 1)}
+            shingle_hashes.extend(zlib.crc32(sh.encode('utf-8')) for sh in shingles)
+            offsets.append(len(shingle_hashes))
+
+        hashed = _fmix64(
+            np.array(shingle_hashes, dtype=np.uint64)[np.newaxis, :] ^ _DEDUP_MINHASH_SEEDS[:, np.newaxis]
+        )
+        blocks.append(np.minimum.reduceat(hashed, offsets[:-1], axis=1).T)
+
+    if not blocks:
+        return np.empty((0, _DEDUP_MINHASH_SEEDS.shape[0]), dtype=np.uint64)
+    return np.vstack(blocks)
+
+
+def _keep_visual_marker(match: re.Match) -> str:
+    """Replacement for TranscriptCleaner._BRACKETED_RE: keep visual markers, drop other tags."""
+    return match.group(0) if match.group('visual') is not None else ''
 
 
 class TranscriptCleaner:
@@ -49,6 +257,18 @@ class TranscriptCleaner:
         r"\[architecture[^\]]*\]",
         r"\[showing[^\]]*\]"
     ]
+
+    # All templates in one alternation: a single scan instead of one per template
+    _REPETITIVE_TEMPLATE_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in REPETITIVE_TEMPLATES), re.IGNORECASE
+    )
+    _TRANSCRIBER_TAG_RE = re.compile('|'.join(re.escape(tag) for tag in sorted(TRANSCRIBER_TAGS)))
+    # Visual markers are the first alternative, so a marker is matched (and kept)
+    # before the generic [tag]/(tag) alternatives can remove it
+    _BRACKETED_RE = re.compile(
+        '(?P<visual>' + '|'.join(VISUAL_MARKERS) + r')|\[[\w\s]+\]|\([\w\s]+\)',
+        re.IGNORECASE
+    )
     
     def __init__(self, custom_filler_words: List[str] = None):
         """
@@ -60,6 +280,11 @@ class TranscriptCleaner:
         self.filler_words = self.DEFAULT_FILLER_WORDS.copy()
         if custom_filler_words:
             self.filler_words.update(word.lower() for word in custom_filler_words)
+
+        # Compiled filler patterns, rebuilt if filler_words changes
+        self._filler_re = None
+        self._filler_template_re = None
+        self._filler_re_words: Set[str] = set()
     
     def remove_timestamps(self, text: str) -> str:
         """
@@ -78,17 +303,13 @@ class TranscriptCleaner:
         Returns:
             Text without timestamps
         """
-        # Pattern: [HH:MM:SS] or [HH:MM:SS.mmm] or (HH:MM:SS)
-        patterns = [
-            r'\[\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?\]',  # [00:15:32] or [00:15:32.123]
-            r'\(\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?\)',  # (00:15:32)
-            r'<\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?>',   # <00:15:32>
-            r'\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?\s*-\s*',  # 00:15:32 -
-            r'^\d{1,2}:\d{2}:\d{2}(?:\.\d{3})?\s+',  # 00:15:32 at start of line
-        ]
+        # Every format contains a colon
+        if ':' not in text:
+            return text
         
-        for pattern in patterns:
-            text = re.sub(pattern, '', text)
+        # Pattern: [HH:MM:SS] or [HH:MM:SS.mmm] or (HH:MM:SS)
+        for pattern in _TIMESTAMP_RES:
+            text = pattern.sub('', text)
         
         return text
     
@@ -109,22 +330,7 @@ class TranscriptCleaner:
         Returns:
             Text without speaker labels
         """
-        patterns = [
-            r'^(?:Speaker\s*\d*|[A-Z][a-z]+)\s*:\s*',  # Speaker 1: or JOHN:
-            r'^\[(?:Speaker\s*\d*|[A-Z][a-z]+)\]\s*:\s*',  # [Speaker 1]:
-            r'^>>\s*(?:Speaker\s*\d*|[A-Z][a-z]+)\s*:\s*',  # >> Speaker 1:
-            r'^\*\*(?:Speaker\s*\d*|[A-Z][a-z]+)\*\*\s*:\s*',  # **Speaker 1**:
-        ]
-        
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            for pattern in patterns:
-                line = re.sub(pattern, '', line, flags=re.IGNORECASE | re.MULTILINE)
-            cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        return _SPEAKER_LABEL_RE.sub('', text)
     
     def remove_transcriber_tags(self, text: str) -> str:
         """
@@ -138,31 +344,10 @@ class TranscriptCleaner:
             Text without transcriber tags (but with visual markers preserved)
         """
         # Remove known tags
-        for tag in self.TRANSCRIBER_TAGS:
-            text = text.replace(tag, '')
+        text = self._TRANSCRIBER_TAG_RE.sub('', text)
         
         # Remove remaining bracketed/parenthesized tags EXCEPT visual markers
-        # First, temporarily replace visual markers with placeholders
-        preserved_markers = {}
-        marker_placeholder_template = "__VISUAL_MARKER_{}_"
-        
-        for i, pattern in enumerate(self.VISUAL_MARKERS):
-            matches = list(re.finditer(pattern, text, flags=re.IGNORECASE))
-            # Process matches in reverse to maintain indices
-            for j, match in reversed(list(enumerate(matches))):
-                placeholder = marker_placeholder_template.format(f"{i}_{j}")
-                preserved_markers[placeholder] = match.group(0)
-                text = text[:match.start()] + placeholder + text[match.end():]
-        
-        # Now remove other bracketed/parenthesized content
-        text = re.sub(r'\[[\w\s]+\]', '', text)
-        text = re.sub(r'\([\w\s]+\)', '', text)
-        
-        # Restore visual markers
-        for placeholder, original in preserved_markers.items():
-            text = text.replace(placeholder, original)
-        
-        return text
+        return self._BRACKETED_RE.sub(_keep_visual_marker, text)
     
     def remove_filler_words(self, text: str) -> str:
         """
@@ -174,14 +359,51 @@ class TranscriptCleaner:
         Returns:
             Text without filler words
         """
-        # Create pattern for filler words
-        # Use word boundaries to avoid partial matches
-        for filler in self.filler_words:
-            # Handle multi-word fillers
-            pattern = r'\b' + re.escape(filler) + r'\b'
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        if not self.filler_words:
+            return text
+
+        self._refresh_filler_patterns()
+        return self._filler_re.sub('', text)
+    
+    def _refresh_filler_patterns(self) -> None:
+        """Compile the filler patterns if filler_words changed since they were built."""
+        if self._filler_template_re is not None and self._filler_re_words == self.filler_words:
+            return
+        
+        template_pattern = self._REPETITIVE_TEMPLATE_RE.pattern
+        if self.filler_words:
+            # One trie-shaped alternation for all fillers, so large custom lists
+            # cost no more per character; the longest filler wins, so "you know"
+            # beats any shorter filler it starts with. Word boundaries avoid
+            # partial matches
+            filler_pattern = r'\b(?:' + _literal_trie_pattern(self.filler_words) + r')\b'
+            self._filler_re = re.compile(filler_pattern, re.IGNORECASE)
+            # Fillers listed first: where a filler and a template start at the same
+            # position the filler wins, as when fillers are removed before templates
+            self._filler_template_re = re.compile(
+                filler_pattern + '|' + template_pattern, re.IGNORECASE
+            )
+        else:
+            self._filler_re = None
+            self._filler_template_re = self._REPETITIVE_TEMPLATE_RE
+        self._filler_re_words = set(self.filler_words)
+    
+    def remove_fillers_and_templates(self, text: str) -> str:
+        """
+        Remove filler words and repetitive templates in a single scan.
         
-        return text
+        Equivalent to remove_filler_words followed by remove_repetitive_templates,
+        except where removing a filler would join text into a new template
+        match (e.g. "now,um let's move on"); such phrases are left in place.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Text without filler words or template phrases
+        """
+        self._refresh_filler_patterns()
+        return self._filler_template_re.sub('', text)
     
     def remove_repetitive_templates(self, text: str) -> str:
         """
@@ -196,11 +418,8 @@ class TranscriptCleaner:
         Returns:
             Text without repetitive templates
         """
-        for pattern in self.REPETITIVE_TEMPLATES:
-            # Remove the phrase (case-insensitive)
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        return text
+        # Remove the phrases (case-insensitive)
+        return self._REPETITIVE_TEMPLATE_RE.sub('', text)
     
     def detect_and_merge_duplicates(self, text: str, similarity_threshold: float = 0.9) -> str:
         """
@@ -216,29 +435,105 @@ class TranscriptCleaner:
         Returns:
             Text with duplicate sentences removed
         """
-        import difflib
+        sentences = [s.strip() for s in text.split('. ')]
+        sentences = [s for s in sentences if s]
+        
+        if len(sentences) >= _DEDUP_LSH_MIN_SENTENCES:
+            return '. '.join(self._dedup_with_lsh(sentences, similarity_threshold))
         
-        sentences = text.split('. ')
         unique_sentences = []
+        # One matcher per kept sentence with the lowercased kept text as
+        # ``b``, so difflib indexes it once instead of once per comparison
+        unique_matchers = []
+        # Kept sentence indices by length band; only bands whose lengths can
+        # reach the threshold are compared (ratio is bounded by the lengths)
+        kept_by_band = defaultdict(list)
+        # Exact repeats (e.g. looped captions) are duplicates without a fuzzy
+        # pass: ratio is 1.0, and a repeat of a dropped sentence matches the
+        # same kept sentence it did
+        seen = set() if similarity_threshold <= 1.0 else None
         
         for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+            sentence_lower = sentence.lower()
+            if seen is not None:
+                if sentence_lower in seen:
+                    continue
+                seen.add(sentence_lower)
+            
+            if similarity_threshold > 0:
+                candidates = (
+                    j for band in _length_bands(len(sentence_lower), similarity_threshold)
+                    for j in kept_by_band.get(band, ())
+                )
+            else:
+                candidates = range(len(unique_sentences))
             
             # Check if this sentence is similar to any already kept
-            is_duplicate = False
-            for kept_sentence in unique_sentences:
-                similarity = difflib.SequenceMatcher(None, sentence.lower(), kept_sentence.lower()).ratio()
-                if similarity >= similarity_threshold:
-                    is_duplicate = True
-                    break
+            is_duplicate = any(
+                _is_similar(_compare_to(unique_matchers[j], sentence_lower), similarity_threshold)
+                for j in candidates
+            )
             
             if not is_duplicate:
+                kept_by_band[len(sentence_lower) // _DEDUP_LENGTH_BAND].append(len(unique_sentences))
                 unique_sentences.append(sentence)
+                unique_matchers.append(difflib.SequenceMatcher(None, b=sentence_lower))
         
         return '. '.join(unique_sentences)
     
+    def _dedup_with_lsh(self, sentences: List[str], similarity_threshold: float) -> List[str]:
+        """
+        Near-duplicate removal for long inputs without comparing every pair.
+        
+        Kept sentences are indexed by MinHash band; a new sentence is only
+        compared (with the same difflib ratio) against kept sentences that
+        share a band. Duplicates whose shingle overlap is too low to share a
+        band are missed, so this trades a little recall for near-linear time.
+        
+        Args:
+            sentences: Stripped, non-empty sentences in order
+            similarity_threshold: difflib ratio at which a sentence is a duplicate
+            
+        Returns:
+            Sentences with near-duplicates of earlier kept sentences removed
+        """
+        lowered = [s.lower() for s in sentences]
+        # Signatures are computed once per distinct sentence
+        signature_rows = {text: row for row, text in enumerate(dict.fromkeys(lowered))}
+        signatures = _minhash_signatures(list(signature_rows))
+        # Exact repeats are duplicates without a fuzzy pass (see the pairwise path)
+        seen = set() if similarity_threshold <= 1.0 else None
+        
+        buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        unique_sentences = []
+        matchers: Dict[int, difflib.SequenceMatcher] = {}
+        for i, sentence in enumerate(sentences):
+            if seen is not None:
+                if lowered[i] in seen:
+                    continue
+                seen.add(lowered[i])
+            
+            row = signature_rows[lowered[i]]
+            band_keys = [
+                (band, signatures[row, band * _DEDUP_LSH_ROWS:(band + 1) * _DEDUP_LSH_ROWS].tobytes())
+                for band in range(_DEDUP_LSH_BANDS)
+            ]
+            
+            # Candidates: earlier kept sentences sharing at least one band
+            candidates = sorted({j for key in band_keys for j in buckets.get(key, ())})
+            is_duplicate = any(
+                _is_similar(_compare_to(matchers[j], lowered[i]), similarity_threshold)
+                for j in candidates
+            )
+            
+            if not is_duplicate:
+                unique_sentences.append(sentence)
+                matchers[i] = difflib.SequenceMatcher(None, b=lowered[i])
+                for key in band_keys:
+                    buckets.setdefault(key, []).append(i)
+        
+        return unique_sentences
+    
     def remove_webvtt_artifacts(self, text: str) -> str:
         """
         Remove WEBVTT format artifacts.
@@ -254,18 +549,20 @@ class TranscriptCleaner:
         Returns:
             Text without WEBVTT artifacts
         """
-        # Remove WEBVTT header
-        text = re.sub(r'WEBVTT\s*', '', text, flags=re.IGNORECASE)
-        
-        # Remove NOTE blocks
-        text = re.sub(r'NOTE\s+[^\n]*\n', '', text, flags=re.IGNORECASE)
-        
-        # Remove STYLE blocks
-        text = re.sub(r'STYLE\s+[^\n]*\n', '', text, flags=re.IGNORECASE)
+        # Each pass is case-insensitive, so gate on one lowercased copy and
+        # only scan for markers that occur; refresh it when a pass removes
+        # something, since a removal can join text into a new marker
+        lowered = text.lower()
+        for marker, pattern in _WEBVTT_BLOCK_RES:
+            if marker in lowered:
+                text, removed = pattern.subn('', text)
+                if removed:
+                    lowered = text.lower()
         
         # Remove position/alignment tags
-        text = re.sub(r'<v\s+[^>]+>', '', text)
-        text = re.sub(r'</v>', '', text)
+        if '<v' in text:
+            text = _WEBVTT_VOICE_OPEN_RE.sub('', text)
+        text = text.replace('</v>', '')
         
         return text
     
@@ -279,11 +576,13 @@ class TranscriptCleaner:
         Returns:
             Text with normalized whitespace
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
+        # Replace multiple spaces with single space (each replace halves every run)
+        while '  ' in text:
+            text = text.replace('  ', ' ')
         
         # Replace multiple newlines with double newline (paragraph break)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        if '\n\n\n' in text:
+            text = _MULTI_NEWLINE_RE.sub('\n\n', text)
         
         # Remove spaces at start/end of lines
         lines = [line.strip() for line in text.split('\n')]
@@ -308,14 +607,20 @@ class TranscriptCleaner:
         Returns:
             Text with fixed punctuation
         """
+        # Every pass needs a punctuation mark
+        if not any(mark in text for mark in _PUNCTUATION_MARKS):
+            return text
+        
         # Add space after punctuation if missing
-        text = re.sub(r'([.!?,;:])([A-Za-z])', r'\1 \2', text)
+        text = _MISSING_SPACE_AFTER_PUNCT_RE.sub(r'\1 \2', text)
         
         # Remove space before punctuation
-        text = re.sub(r'\s+([.!?,;:])', r'\1', text)
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
         
-        # Fix multiple punctuation
-        text = re.sub(r'([.!?]){2,}', r'\1', text)
+        # Fix multiple punctuation; a run needs two adjacent marks, which a
+        # few substring checks rule out faster than a regex scan
+        if any(pair in text for pair in _REPEATED_PUNCT_PAIRS):
+            text = _REPEATED_PUNCT_RE.sub(r'\1', text)
         
         return text
     
@@ -329,7 +634,7 @@ class TranscriptCleaner:
         3. Remove speaker labels
         4. Remove transcriber tags (preserve visual markers)
         5. Remove filler words
-        6. Remove repetitive templates (NEW)
+        6. Remove repetitive templates (NEW; same scan as step 5)
         7. Detect and merge duplicates (NEW - optional)
         8. Fix punctuation
         9. Normalize whitespace
@@ -346,8 +651,7 @@ class TranscriptCleaner:
         text = self.remove_timestamps(text)
         text = self.remove_speaker_labels(text)
         text = self.remove_transcriber_tags(text)  # Now preserves visual markers
-        text = self.remove_filler_words(text)
-        text = self.remove_repetitive_templates(text)  # Remove template phrases
+        text = self.remove_fillers_and_templates(text)  # Fillers + template phrases, one scan
         if remove_duplicates:
             text = self.detect_and_merge_duplicates(text)  # Deduplicate content
         text = self.fix_punctuation(text)
@@ -356,6 +660,27 @@ class TranscriptCleaner:
         return text
 
 
+# NLTK's English Punkt model, loaded once per process
+_punkt_tokenizer = None
+
+
+def _get_punkt_tokenizer():
+    """
+    Load the Punkt model that nltk.tokenize.sent_tokenize uses.
+
+    sent_tokenize resolves the model through nltk.data.load on every call;
+    holding it here leaves only the tokenize() call per line.
+
+    Returns:
+        PunktSentenceTokenizer for English
+    """
+    global _punkt_tokenizer
+    if _punkt_tokenizer is None:
+        import nltk
+        _punkt_tokenizer = nltk.data.load('tokenizers/punkt/english.pickle')
+    return _punkt_tokenizer
+
+
 class SentenceTokenizer:
     """Break transcript into sentences using NLTK."""
     
@@ -370,11 +695,15 @@ class SentenceTokenizer:
                 # Download if not available
                 nltk.download('punkt', quiet=True)
             
-            self.tokenizer = nltk.tokenize.sent_tokenize
+            self.tokenizer = _get_punkt_tokenizer().tokenize
         except Exception as e:
             # Fallback to simple regex tokenizer
             print(f"Warning: NLTK not available ({e}), using simple tokenizer")
             self.tokenizer = self._simple_tokenize
+        
+        # The pipeline tokenizes the cleaned transcript and then chunks the same
+        # string; keyed by the text itself (str caches its hash)
+        self._tokenize_cached = lru_cache(maxsize=_TOKENIZE_CACHE_SIZE)(self._tokenize_uncached)
     
     def _simple_tokenize(self, text: str) -> List[str]:
         """
@@ -386,18 +715,16 @@ class SentenceTokenizer:
         Returns:
             List of sentences
         """
-        # Split on sentence-ending punctuation followed by space and capital
-        sentences = re.split(r'([.!?]+)\s+(?=[A-Z])', text)
-        
-        # Recombine punctuation with sentences
+        # Split on sentence-ending punctuation followed by space and capital;
+        # each sentence runs up to and including its punctuation
         result = []
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i] + sentences[i + 1]
-            result.append(sentence.strip())
+        start = 0
+        for match in _SENTENCE_SPLIT_RE.finditer(text):
+            result.append(text[start:match.end(1)].strip())
+            start = match.end()
         
         # Add last sentence if exists
-        if sentences and len(sentences) % 2 == 1:
-            result.append(sentences[-1].strip())
+        result.append(text[start:].strip())
         
         return [s for s in result if s]
     
@@ -405,18 +732,40 @@ class SentenceTokenizer:
         """
         Break text into sentences.
         
+        Results are cached per text, so repeated calls with the same string
+        (e.g. sentence extraction, then chunking) only tokenize once.
+        
         Args:
             text: Input text
             
         Returns:
             List of sentences
         """
-        sentences = self.tokenizer(text)
-        
-        # Filter out very short sentences (likely artifacts)
-        sentences = [s for s in sentences if len(s.strip()) > 3]
+        return list(self._tokenize_cached(text))
+    
+    def _tokenize_uncached(self, text: str) -> Tuple[str, ...]:
+        """Tokenize and drop very short sentences (likely artifacts)."""
+        return tuple(s for s in self.tokenizer(text) if len(s.strip()) > 3)
 
-        return sentences
+
+# Singleton instance
+_sentence_tokenizer: Optional[SentenceTokenizer] = None
+
+
+def get_sentence_tokenizer() -> SentenceTokenizer:
+    """
+    Get or create the shared sentence tokenizer.
+    
+    The NLTK data lookup (and download, if missing) then happens once per
+    process instead of on every chunker or parser construction.
+    
+    Returns:
+        SentenceTokenizer singleton instance
+    """
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        _sentence_tokenizer = SentenceTokenizer()
+    return _sentence_tokenizer
 
 
 class TranscriptChunker:
@@ -437,9 +786,9 @@ class TranscriptChunker:
         Initialize chunker.
 
         Args:
-            sentence_tokenizer: Optional tokenizer to use. If None, creates new one.
+            sentence_tokenizer: Optional tokenizer to use. If None, uses the shared one.
         """
-        self.tokenizer = sentence_tokenizer or SentenceTokenizer()
+        self.tokenizer = sentence_tokenizer or get_sentence_tokenizer()
 
     def chunk_by_sentences(
         self,
@@ -478,15 +827,12 @@ class TranscriptChunker:
             min(max_sentences_per_chunk, -(-total_sentences // target_chunks))  # Ceiling division
         )
 
-        # Create chunks
-        chunks = []
-        for i in range(0, total_sentences, sentences_per_chunk):
-            chunk_sentences = sentences[i:i + sentences_per_chunk]
-            # Join sentences with space
-            chunk_text = ' '.join(chunk_sentences)
-            chunks.append(chunk_text.strip())
-
-        return chunks
+        # Create chunks, joining consecutive runs of sentences with a space
+        sentence_iter = iter(sentences)
+        return [
+            ' '.join(islice(sentence_iter, sentences_per_chunk)).strip()
+            for _ in range(-(-total_sentences // sentences_per_chunk))
+        ]
 
     def chunk_by_paragraphs(
         self,
@@ -519,14 +865,12 @@ class TranscriptChunker:
         # Group paragraphs into target_chunks groups
         paragraphs_per_chunk = -(-len(paragraphs) // target_chunks)  # Ceiling division
 
-        chunks = []
-        for i in range(0, len(paragraphs), paragraphs_per_chunk):
-            chunk_paragraphs = paragraphs[i:i + paragraphs_per_chunk]
-            # Join paragraphs with double newline
-            chunk_text = '\n\n'.join(chunk_paragraphs)
-            chunks.append(chunk_text.strip())
-
-        return chunks
+        # Join consecutive runs of paragraphs with a double newline
+        paragraph_iter = iter(paragraphs)
+        return [
+            '\n\n'.join(islice(paragraph_iter, paragraphs_per_chunk)).strip()
+            for _ in range(-(-len(paragraphs) // paragraphs_per_chunk))
+        ]
 
     def chunk_smart(
         self,
@@ -545,7 +889,11 @@ class TranscriptChunker:
         Returns:
             List of chunk strings
         """
-        if prefer_paragraphs and '\n\n' in transcript:
+        # split('\n\n') yields count + 1 pieces, an upper bound on the paragraphs;
+        # with fewer than target_chunks - 1 the paragraph chunks would be
+        # rejected below, so skip splitting the transcript at all
+        paragraph_breaks = transcript.count('\n\n')
+        if prefer_paragraphs and paragraph_breaks and paragraph_breaks + 1 >= target_chunks - 1:
             # Try paragraph-based chunking
             paragraph_chunks = self.chunk_by_paragraphs(transcript, target_chunks)
 
@@ -8,11 +8,17 @@ import logging
 from typing import List, Tuple, Optional, Dict
 from dataclasses import dataclass, field
 from collections import Counter
+from functools import lru_cache
+
+from .transcript_cleaner import get_sentence_tokenizer
 
 logger = logging.getLogger(__name__)
 
+# Sentence classifications kept per TranscriptParser
+_CLASSIFY_CACHE_SIZE = 4096
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSentence:
     """A single parsed sentence with metadata and characteristics."""
 
@@ -50,7 +56,7 @@ class ParsedSentence:
         return " ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptMetadata:
     """Overall transcript metadata and statistics."""
 
@@ -120,19 +126,57 @@ class TranscriptParser:
         r'\bthe next (?:thing|topic|item)\b',
     ]
 
+    # Letters every transition phrase can start with (keep in sync with
+    # TRANSITION_PHRASES); positions starting with anything else are
+    # rejected before trying each phrase
+    TRANSITION_FIRST_LETTERS = 'aflmnopst'
+
+    # Timestamp formats at the start of a line, in priority order; each has
+    # exactly four groups: hours, minutes, seconds, milliseconds
+    TIMESTAMP_PATTERNS = [
+        r'^\[(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\]\s*',  # [00:01:05] or [00:01:05.123]
+        r'^\((\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\)\s*',  # (00:01:05)
+        r'^<(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?>?\s*',   # <00:01:05>
+        r'^(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\s*-\s*',  # 00:01:05 -
+        r'^(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\s+',      # 00:01:05 (space after)
+    ]
+
+    # Speaker label formats at the start of a line: group 1 is the name
+    SPEAKER_PATTERNS = [
+        r'^(Speaker\s*\d*)\s*:\s*',                          # Speaker 1: or Speaker:
+        r'^([A-Z][a-z]+)\s*:\s*',                            # JOHN: or John:
+        r'^\[(Speaker\s*\d*|[A-Z][a-z]+)\]\s*:\s*',          # [Speaker 1]: or [John]:
+        r'^>>\s*(Speaker\s*\d*|[A-Z][a-z]+)\s*:\s*',         # >> Speaker 1:
+        r'^\*\*(Speaker\s*\d*|[A-Z][a-z]+)\*\*\s*:\s*',      # **Speaker 1**:
+    ]
+
     # Question indicators (beyond just "?")
-    QUESTION_WORDS = [
+    QUESTION_WORDS = frozenset({
         'what', 'when', 'where', 'who', 'whom', 'whose',
         'why', 'how', 'which', 'can', 'could', 'would',
         'should', 'is', 'are', 'do', 'does', 'did'
-    ]
+    })
 
     def __init__(self):
         """Initialize parser with compiled regex patterns."""
-        self.transition_pattern = re.compile(
-            '|'.join(self.TRANSITION_PHRASES),
-            re.IGNORECASE
+        transition_regex = (
+            f'(?=[{self.TRANSITION_FIRST_LETTERS}])(?:' + '|'.join(self.TRANSITION_PHRASES) + ')'
+        )
+        self.transition_pattern = re.compile(transition_regex, re.IGNORECASE)
+        # Case-sensitive twin for lowercased ASCII text: same matches without
+        # case folding at every position (non-ASCII text keeps IGNORECASE,
+        # which also folds e.g. the Kelvin sign and long s)
+        self.lowercase_transition_pattern = re.compile(transition_regex)
+        # One alternation tries the formats in order in a single match() call
+        self.timestamp_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.TIMESTAMP_PATTERNS)
         )
+        self.speaker_patterns = [re.compile(p, re.IGNORECASE) for p in self.SPEAKER_PATTERNS]
+        self.caps_pattern = re.compile(r'\b[A-Z]{3,}\b')
+        self.markdown_emphasis_pattern = re.compile(r'\*\*[^*]+\*\*|__[^_]+__|[*_][^*_]+[*_]')
+        # Short replies ("Yeah.", "Mhm.", "Okay.") repeat throughout a
+        # conversation; keyed by the sentence text
+        self._classify = lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(self._classify_uncached)
 
     def parse(self, raw_transcript: str) -> Tuple[List[ParsedSentence], TranscriptMetadata]:
         """
@@ -231,31 +275,22 @@ class TranscriptParser:
         Returns:
             (timestamp_in_seconds, line_without_timestamp)
         """
-        # Try bracketed formats: [HH:MM:SS], (HH:MM:SS), <HH:MM:SS>
-        patterns = [
-            r'^\[(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\]\s*',  # [00:01:05] or [00:01:05.123]
-            r'^\((\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\)\s*',  # (00:01:05)
-            r'^<(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?>?\s*',   # <00:01:05>
-            r'^(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\s*-\s*',  # 00:01:05 -
-            r'^(\d{1,2}):(\d{2}):(\d{2})(?:\.(\d{3}))?\s+',      # 00:01:05 (space after)
-        ]
+        # Try bracketed formats: [HH:MM:SS], (HH:MM:SS), <HH:MM:SS>, then bare
+        match = self.timestamp_pattern.match(line)
+        if not match:
+            # No timestamp found
+            return None, line
 
-        for pattern in patterns:
-            match = re.match(pattern, line)
-            if match:
-                groups = match.groups()
-                hours = int(groups[0])
-                minutes = int(groups[1])
-                seconds = int(groups[2])
-                # milliseconds = int(groups[3]) if groups[3] else 0
+        # The last group set (seconds or milliseconds) lies in the matched
+        # format's run of four groups
+        first = (match.lastindex - 1) // 4 * 4 + 1
+        hours, minutes, seconds = map(int, match.group(first, first + 1, first + 2))
+        # milliseconds = int(match.group(first + 3)) if match.group(first + 3) else 0
 
-                total_seconds = hours * 3600 + minutes * 60 + seconds
-                remaining_text = line[match.end():]
+        total_seconds = hours * 3600 + minutes * 60 + seconds
+        remaining_text = line[match.end():]
 
-                return total_seconds, remaining_text
-
-        # No timestamp found
-        return None, line
+        return total_seconds, remaining_text
 
     def _extract_speaker(self, line: str) -> Tuple[Optional[str], str]:
         """
@@ -274,16 +309,8 @@ class TranscriptParser:
         Returns:
             (speaker_name, line_without_speaker)
         """
-        patterns = [
-            r'^(Speaker\s*\d*)\s*:\s*',                          # Speaker 1: or Speaker:
-            r'^([A-Z][a-z]+)\s*:\s*',                            # JOHN: or John:
-            r'^\[(Speaker\s*\d*|[A-Z][a-z]+)\]\s*:\s*',          # [Speaker 1]: or [John]:
-            r'^>>\s*(Speaker\s*\d*|[A-Z][a-z]+)\s*:\s*',         # >> Speaker 1:
-            r'^\*\*(Speaker\s*\d*|[A-Z][a-z]+)\*\*\s*:\s*',      # **Speaker 1**:
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, line, flags=re.IGNORECASE)
+        for pattern in self.speaker_patterns:
+            match = pattern.match(line)
             if match:
                 speaker = match.group(1)
                 remaining_text = line[match.end():]
@@ -302,9 +329,7 @@ class TranscriptParser:
         Returns:
             Sentences with metadata (each sentence inherits line's metadata)
         """
-        from .transcript_cleaner import SentenceTokenizer
-
-        tokenizer = SentenceTokenizer()
+        tokenizer = get_sentence_tokenizer()
         sentences_with_metadata = []
 
         for line_meta in lines_with_metadata:
@@ -340,6 +365,7 @@ class TranscriptParser:
 
         for i, sent_meta in enumerate(sentences_with_metadata):
             text = sent_meta['text']
+            is_question, is_transition, has_emphasis = self._classify(text)
 
             # Create ParsedSentence with analysis
             parsed = ParsedSentence(
@@ -351,9 +377,9 @@ class TranscriptParser:
                 speaker_role=None,  # Will be set later
 
                 # Analyze characteristics
-                is_question=self._is_question(text),
-                is_transition=self._is_transition(text),
-                has_emphasis=self._has_emphasis(text),
+                is_question=is_question,
+                is_transition=is_transition,
+                has_emphasis=has_emphasis,
 
                 # Relationships (will be computed later)
                 follows_long_pause=False,
@@ -364,6 +390,10 @@ class TranscriptParser:
 
         return parsed_sentences
 
+    def _classify_uncached(self, text: str) -> Tuple[bool, bool, bool]:
+        """Classify a sentence as (is_question, is_transition, has_emphasis)."""
+        return self._is_question(text), self._is_transition(text), self._has_emphasis(text)
+
     def _is_question(self, text: str) -> bool:
         """
         Determine if sentence is a question.
@@ -379,18 +409,16 @@ class TranscriptParser:
         Returns:
             True if sentence is a question
         """
-        text_lower = text.lower().strip()
+        text = text.strip()
 
         # Check for "?"
-        if text.strip().endswith('?'):
+        if text.endswith('?'):
             return True
 
-        # Check for question words at start
-        for word in self.QUESTION_WORDS:
-            if text_lower.startswith(word + ' ') or text_lower == word:
-                return True
-
-        return False
+        # Check for question words at start: the text up to the first space
+        # (or all of it) must be one of them
+        first_word = text.partition(' ')[0]
+        return first_word.lower() in self.QUESTION_WORDS
 
     def _is_transition(self, text: str) -> bool:
         """
@@ -402,6 +430,8 @@ class TranscriptParser:
         Returns:
             True if sentence has transition phrase
         """
+        if text.isascii():
+            return bool(self.lowercase_transition_pattern.search(text.lower()))
         return bool(self.transition_pattern.search(text))
 
     def _has_emphasis(self, text: str) -> bool:
@@ -420,11 +450,11 @@ class TranscriptParser:
             True if sentence has emphasis markers
         """
         # Check for ALL CAPS words (3+ letters)
-        if re.search(r'\b[A-Z]{3,}\b', text):
+        if self.caps_pattern.search(text):
             return True
 
-        # Check for markdown emphasis
-        if re.search(r'\*\*[^*]+\*\*|__[^_]+__|[*_][^*_]+[*_]', text):
+        # Check for markdown emphasis (every marker contains "*" or "_")
+        if ('*' in text or '_' in text) and self.markdown_emphasis_pattern.search(text):
             return True
 
         return False
@@ -481,20 +511,26 @@ class TranscriptParser:
         speaker_names = list(speaker_counts.keys())
         total_speakers = len(speaker_names)
 
-        # Identify primary speaker (most frequent)
+        # Identify primary speaker (most frequent; ties go to whoever spoke first)
         primary_speaker = None
         primary_speaker_ratio = 0.0
         if speaker_counts:
-            primary_speaker = speaker_counts.most_common(1)[0][0]
+            primary_speaker = max(speaker_counts, key=speaker_counts.get)
             primary_speaker_ratio = speaker_counts[primary_speaker] / len(parsed_sentences)
 
         # Assign speaker roles (primary = instructor, others = participants)
+        # and detect Q&A sections (questions from participants) as we go
+        has_qa_sections = False
         for sentence in parsed_sentences:
             if sentence.speaker:
                 if sentence.speaker == primary_speaker:
                     sentence.speaker_role = "instructor"
                 else:
                     sentence.speaker_role = "participant"
+                    if sentence.is_question:
+                        has_qa_sections = True
+            elif sentence.is_question and sentence.speaker_role == "participant":
+                has_qa_sections = True
 
         # Compute duration
         timestamps = [s.timestamp for s in parsed_sentences if s.timestamp is not None]
@@ -505,12 +541,6 @@ class TranscriptParser:
         question_count = sum(1 for s in parsed_sentences if s.is_question)
         transition_count = sum(1 for s in parsed_sentences if s.is_transition)
 
-        # Detect Q&A sections (questions from participants)
-        has_qa_sections = any(
-            s.is_question and s.speaker_role == "participant"
-            for s in parsed_sentences
-        )
-
         return TranscriptMetadata(
             total_sentences=len(parsed_sentences),
             total_speakers=total_speakers,
@@ -14,55 +14,58 @@ sys.path.insert(0, str(backend_dir))
 from script_to_doc.action_validator import ActionValidator, WEAK_VERBS, STRONG_VERBS
 
 
-def analyze_document(docx_path):
-    """Analyze generated document for Week 0 quality metrics."""
+# Longest section header checked below ("KEY ACTIONS:")
+_HEADER_LENGTH = len("KEY ACTIONS:")
 
-    doc = Document(docx_path)
-    validator = ActionValidator(min_actions=3, max_actions=6, min_content_words=50)
 
-    print("=" * 80)
-    print("WEEK 0 QUALITY ANALYSIS")
-    print("=" * 80)
-    print(f"\nDocument: {docx_path.name}")
-    print()
+def _close_step(step):
+    """Join the accumulated summary/details parts of a parsed step."""
+    step["summary"] = " ".join(step["summary"])
+    step["details"] = " ".join(step["details"])
+    return step
 
-    # Parse steps from document
-    steps = []
+
+def iter_steps(paragraphs):
+    """Yield steps (title, summary, details, actions) parsed from document paragraphs."""
     current_step = None
     current_section = None
 
-    for para in doc.paragraphs:
+    for para in paragraphs:
         text = para.text.strip()
 
         if text.startswith("STEP "):
-            # Save previous step
+            # Yield previous step
             if current_step:
-                steps.append(current_step)
+                yield _close_step(current_step)
 
             # Start new step
             title = text.split(":", 1)[1].strip() if ":" in text else ""
             current_step = {
                 "title": title,
-                "summary": "",
-                "details": "",
+                # Text parts, joined with spaces when the step is closed
+                "summary": [""],
+                "details": [""],
                 "actions": []
             }
             current_section = None
 
         elif current_step:
-            if text.upper().startswith("OVERVIEW:") or text.upper().startswith("SUMMARY:"):
+            # Headers are short; upper-case only the prefix they can occupy
+            header = text[:_HEADER_LENGTH].upper()
+
+            if header.startswith(("OVERVIEW:", "SUMMARY:")):
                 current_section = "summary"
                 content = text.split(":", 1)[1].strip() if ":" in text else ""
                 if content:
-                    current_step["summary"] = content
+                    current_step["summary"] = [content]
 
-            elif text.upper().startswith("CONTENT:") or text.upper().startswith("DETAILS:"):
+            elif header.startswith(("CONTENT:", "DETAILS:")):
                 current_section = "details"
                 content = text.split(":", 1)[1].strip() if ":" in text else ""
                 if content:
-                    current_step["details"] = content
+                    current_step["details"] = [content]
 
-            elif text.upper().startswith("KEY ACTIONS:") or text.upper().startswith("ACTIONS:"):
+            elif header.startswith(("KEY ACTIONS:", "ACTIONS:")):
                 current_section = "actions"
 
             elif current_section == "actions" and text.startswith("-"):
@@ -71,14 +74,30 @@ def analyze_document(docx_path):
                     current_step["actions"].append(action)
 
             elif current_section == "summary" and text and not text.startswith("-"):
-                current_step["summary"] += " " + text
+                current_step["summary"].append(text)
 
             elif current_section == "details" and text and not text.startswith("-"):
-                current_step["details"] += " " + text
+                current_step["details"].append(text)
 
-    # Save last step
+    # Yield last step
     if current_step:
-        steps.append(current_step)
+        yield _close_step(current_step)
+
+
+def analyze_document(docx_path):
+    """Analyze generated document for Week 0 quality metrics."""
+
+    doc = Document(docx_path)
+    validator = ActionValidator(min_actions=3, max_actions=6, min_content_words=50)
+
+    print("=" * 80)
+    print("WEEK 0 QUALITY ANALYSIS")
+    print("=" * 80)
+    print(f"\nDocument: {docx_path.name}")
+    print()
+
+    # Parse steps from document
+    steps = list(iter_steps(doc.paragraphs))
 
     print(f"Total steps found: {len(steps)}\n")
 
@@ -106,7 +125,8 @@ def analyze_document(docx_path):
         strong_verbs = []
 
         for action in step['actions']:
-            first_word = action.split()[0].lower().strip('.,!?;:()[]{}"\' ') if action.split() else ""
+            words = action.split(None, 1)
+            first_word = words[0].lower().strip('.,!?;:()[]{}"\' ') if words else ""
 
             if first_word in WEAK_VERBS:
                 weak_verbs.append(first_word)
@@ -125,7 +145,8 @@ def analyze_document(docx_path):
         print(f"✓ Content words: {word_count} {'✅' if word_count >= 50 else '❌'}")
 
         # Title check
-        first_word_title = step['title'].split()[0].lower() if step['title'].split() else ""
+        title_words = step['title'].split(None, 1)
+        first_word_title = title_words[0].lower() if title_words else ""
         is_action_title = first_word_title in STRONG_VERBS or first_word_title.endswith('ing')
         print(f"✓ Action-oriented title: {'✅' if is_action_title else '⚠️'}")
 
@@ -3,16 +3,58 @@ Cleanup script to delete all jobs from Cosmos DB.
 Run this to start fresh with an empty database.
 """
 
+import asyncio
 import os
 import sys
+from itertools import islice
 from pathlib import Path
 from azure.cosmos import CosmosClient
+from azure.cosmos.aio import CosmosClient as AsyncCosmosClient
 from dotenv import load_dotenv
 
 # Load environment variables
 env_path = Path(__file__).parent / ".env"
 load_dotenv(env_path)
 
+# Number of delete requests kept in flight at once
+DELETE_BATCH_SIZE = 50
+
+
+async def _delete_item(container, item):
+    """Delete one job using its user_id partition key."""
+    await container.delete_item(item=item['id'], partition_key=item['user_id'])
+
+
+async def delete_items(items, total_items, cosmos_endpoint, cosmos_key, cosmos_database, cosmos_container):
+    """
+    Delete jobs concurrently, DELETE_BATCH_SIZE requests at a time.
+
+    Returns:
+        (deleted_count, failed_count)
+    """
+    deleted_count = 0
+    failed_count = 0
+    items = iter(items)
+
+    async with AsyncCosmosClient(url=cosmos_endpoint, credential=cosmos_key) as client:
+        database = client.get_database_client(cosmos_database)
+        container = database.get_container_client(cosmos_container)
+
+        while batch := list(islice(items, DELETE_BATCH_SIZE)):
+            results = await asyncio.gather(
+                *(_delete_item(container, item) for item in batch),
+                return_exceptions=True
+            )
+            for item, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    failed_count += 1
+                    print(f"   ✗ Failed to delete {item['id'][:8]}...: {result}")
+                else:
+                    deleted_count += 1
+                    print(f"   ✓ Deleted {item['id'][:8]}... ({deleted_count}/{total_items})")
+
+    return deleted_count, failed_count
+
 def cleanup_database():
     """Delete all jobs from Cosmos DB."""
 
@@ -43,24 +85,24 @@ def cleanup_database():
 
     print(f"\n📊 Fetching all jobs from database...")
 
-    # Query all items
+    # Count, then stream only the fields that are printed or needed to delete
     try:
-        query = "SELECT * FROM c"
-        items = list(container.query_items(
-            query=query,
+        total_items = next(iter(container.query_items(
+            query="SELECT VALUE COUNT(1) FROM c",
             enable_cross_partition_query=True
-        ))
-
-        total_items = len(items)
+        )))
 
         if total_items == 0:
             print("✅ Database is already empty! No jobs to delete.")
             return
 
         print(f"\n🗑️  Found {total_items} job(s) to delete:")
-        for item in items:
+        for item in container.query_items(
+            query="SELECT c.id, c.status, c.config.document_title, c.created_at FROM c",
+            enable_cross_partition_query=True
+        ):
             status = item.get('status', 'unknown')
-            doc_title = item.get('config', {}).get('document_title', 'Untitled')
+            doc_title = item.get('document_title', 'Untitled')
             created_at = item.get('created_at', 'unknown')
             print(f"   - {item['id'][:8]}... | {status:12} | {doc_title[:40]} | {created_at}")
 
@@ -73,20 +115,13 @@ def cleanup_database():
 
         # Delete all items
         print(f"\n🔄 Deleting {total_items} job(s)...")
-        deleted_count = 0
-        failed_count = 0
-
-        for item in items:
-            try:
-                container.delete_item(
-                    item=item['id'],
-                    partition_key=item['user_id']
-                )
-                deleted_count += 1
-                print(f"   ✓ Deleted {item['id'][:8]}... ({deleted_count}/{total_items})")
-            except Exception as e:
-                failed_count += 1
-                print(f"   ✗ Failed to delete {item['id'][:8]}...: {e}")
+        items = container.query_items(
+            query="SELECT c.id, c.user_id FROM c",
+            enable_cross_partition_query=True
+        )
+        deleted_count, failed_count = asyncio.run(delete_items(
+            items, total_items, cosmos_endpoint, cosmos_key, cosmos_database, cosmos_container
+        ))
 
         print(f"\n✅ Cleanup complete!")
         print(f"   ✓ Successfully deleted: {deleted_count} job(s)")
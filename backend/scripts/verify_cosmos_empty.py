@@ -9,6 +9,9 @@ import os
 from dotenv import load_dotenv
 import sys
 
+# Documents fetched per round trip when listing leftovers
+PAGE_SIZE = 100
+
 def main():
     load_dotenv()
 
@@ -31,29 +34,42 @@ def main():
         database = client.get_database_client(database_name)
         container = database.get_container_client(container_name)
 
-        # Query all documents
+        # Count documents without fetching them
         print("Querying all documents...")
-        query = "SELECT * FROM c"
-        items = list(container.query_items(query=query, enable_cross_partition_query=True))
+        total_items = next(iter(container.query_items(
+            query="SELECT VALUE COUNT(1) FROM c",
+            enable_cross_partition_query=True
+        )))
 
-        print(f"Documents found: {len(items)}")
+        print(f"Documents found: {total_items}")
         print()
 
-        if len(items) == 0:
+        if total_items == 0:
             print("✅ SUCCESS: Cosmos DB is completely empty!")
             print()
             return 0
         else:
-            print(f"⚠️  WARNING: {len(items)} documents still exist:")
+            print(f"⚠️  WARNING: {total_items} documents still exist:")
             print()
 
-            for i, item in enumerate(items, 1):
-                print(f"{i}. ID: {item.get('id')}")
-                print(f"   Status: {item.get('status', 'N/A')}")
-                print(f"   user_id: {item.get('user_id', 'MISSING')}")
-                print(f"   userId: {item.get('userId', 'MISSING')}")
-                print(f"   Created: {item.get('created_at', 'N/A')}")
-                print()
+            # Page through only the printed fields
+            pages = container.query_items(
+                query="SELECT c.id, c.status, c.user_id, c.userId, c.created_at FROM c",
+                enable_cross_partition_query=True,
+                max_item_count=PAGE_SIZE,
+                populate_query_metrics=False
+            ).by_page()
+
+            i = 0
+            for page in pages:
+                for item in page:
+                    i += 1
+                    print(f"{i}. ID: {item.get('id')}")
+                    print(f"   Status: {item.get('status', 'N/A')}")
+                    print(f"   user_id: {item.get('user_id', 'MISSING')}")
+                    print(f"   userId: {item.get('userId', 'MISSING')}")
+                    print(f"   Created: {item.get('created_at', 'N/A')}")
+                    print()
 
             print("If these documents still appear after 5 minutes, they may need")
             print("manual deletion via Azure Portal Data Explorer.")
@@ -17,9 +17,14 @@ setup(
         "openai==1.10.0",
         "python-docx==1.1.0",
         "nltk==3.8.1",
+        "numpy==1.26.4",
         "pydantic==2.5.3",
         "pydantic-settings==2.1.0",
     ],
-    python_requires=">=3.9",
+    extras_require={
+        # JIT-compiled topic segment coherence; falls back to pure Python
+        "jit": ["numba==0.60.0"],
+    },
+    python_requires=">=3.10",
 )
 
@@ -6,21 +6,25 @@ Quick test to verify confidence indicators are removed from generated documents.
 import os
 import sys
 from docx import Document
+from docx.oxml.simpletypes import ST_Merge
 
 # Test output file from previous runs
 test_doc_path = "backend/test_output/sample_results/phase1_e2e_result.docx"
 
 # Alternative: check if there's a recent document in output/
-output_docs = []
+latest_doc = None
 if os.path.exists("backend/output"):
-    for file in os.listdir("backend/output"):
-        if file.endswith(".docx"):
-            full_path = os.path.join("backend/output", file)
-            output_docs.append(full_path)
+    # DirEntry carries the name and path, so only the mtime needs a stat
+    with os.scandir("backend/output") as entries:
+        latest_doc = max(
+            (entry for entry in entries if entry.name.endswith(".docx")),
+            key=lambda entry: entry.stat().st_mtime,
+            default=None
+        )
 
 # Use most recent document
-if output_docs:
-    test_doc_path = max(output_docs, key=os.path.getmtime)
+if latest_doc is not None:
+    test_doc_path = latest_doc.path
 elif os.path.exists(test_doc_path):
     pass
 else:
@@ -45,11 +49,41 @@ forbidden_phrases = [
     "Very Low"
 ]
 
+
+def iter_cell_texts(tbl):
+    """
+    Yield (row, cell, text) for every grid cell of a table element.
+
+    Mirrors python-docx's row.cells (spanned and vertically merged cells are
+    repeated) but builds the grid once per table instead of once per row.
+    """
+    col_count = tbl.col_count
+    grid = []
+    for tc in tbl.iter_tcs():
+        text = "\n".join(p.text for p in tc.p_lst)
+        for grid_span_idx in range(tc.grid_span):
+            if tc.vMerge == ST_Merge.CONTINUE:
+                grid.append(grid[-col_count])
+            elif grid_span_idx > 0:
+                grid.append(grid[-1])
+            else:
+                grid.append(text)
+
+    for row_idx in range(len(tbl.tr_lst)):
+        start = row_idx * col_count
+        for cell_idx, text in enumerate(grid[start:start + col_count]):
+            yield row_idx, cell_idx, text
+
+
+# Walk the underlying XML elements directly; the Paragraph/_Cell wrappers
+# add nothing for a read-only scan
+body = doc.element.body
+
 # Search through all paragraphs
 found_issues = []
 
-for i, para in enumerate(doc.paragraphs):
-    text = para.text
+for i, p in enumerate(body.p_lst):
+    text = p.text
     for phrase in forbidden_phrases:
         if phrase in text:
             found_issues.append({
@@ -59,19 +93,17 @@ for i, para in enumerate(doc.paragraphs):
             })
 
 # Search through tables
-for table_idx, table in enumerate(doc.tables):
-    for row_idx, row in enumerate(table.rows):
-        for cell_idx, cell in enumerate(row.cells):
-            text = cell.text
-            for phrase in forbidden_phrases:
-                if phrase in text:
-                    found_issues.append({
-                        'table': table_idx,
-                        'row': row_idx,
-                        'cell': cell_idx,
-                        'phrase': phrase,
-                        'context': text[:100] + ('...' if len(text) > 100 else '')
-                    })
+for table_idx, tbl in enumerate(body.tbl_lst):
+    for row_idx, cell_idx, text in iter_cell_texts(tbl):
+        for phrase in forbidden_phrases:
+            if phrase in text:
+                found_issues.append({
+                    'table': table_idx,
+                    'row': row_idx,
+                    'cell': cell_idx,
+                    'phrase': phrase,
+                    'context': text[:100] + ('...' if len(text) > 100 else '')
+                })
 
 # Report results
 print("=" * 70)
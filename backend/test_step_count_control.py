@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from script_to_doc.pipeline import ScriptToDocPipeline, PipelineConfig
+from script_to_doc.transcript_cleaner import TranscriptCleaner, TranscriptChunker
 
 def test_step_count_control():
     """Verify that the pipeline respects user's target_steps when Phase 1 is disabled."""
@@ -41,6 +42,12 @@ def test_step_count_control():
     print("=" * 80)
     print()
 
+    # Clean once; the chunker's shared tokenizer caches the sentences of the
+    # cleaned text, so only the first chunk_smart call tokenizes it
+    cleaner = TranscriptCleaner()
+    chunker = TranscriptChunker()
+    cleaned = cleaner.normalize(transcript)
+
     # Test different target_steps values
     for target_steps in [3, 6, 10]:
         print(f"\n📊 Testing with target_steps={target_steps}")
@@ -61,13 +68,6 @@ def test_step_count_control():
         pipeline = ScriptToDocPipeline(config)
 
         # Access the chunker directly to test
-        from script_to_doc.transcript_cleaner import TranscriptCleaner, SentenceTokenizer, TranscriptChunker
-
-        cleaner = TranscriptCleaner()
-        tokenizer = SentenceTokenizer()
-        chunker = TranscriptChunker(tokenizer)
-
-        cleaned = cleaner.normalize(transcript)
         chunks = chunker.chunk_smart(cleaned, target_chunks=target_steps, prefer_paragraphs=True)
 
         print(f"  ✅ Requested: {target_steps} steps")
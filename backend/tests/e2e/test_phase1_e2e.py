@@ -5,20 +5,83 @@ Tests parser + segmenter + step generation to measure quality improvements.
 
 import sys
 import os
+import hashlib
+import json
+from dataclasses import asdict
+from itertools import islice
 from pathlib import Path
 
 # Add backend to path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from script_to_doc.pipeline import ScriptToDocPipeline, PipelineConfig
+import script_to_doc
+from script_to_doc.pipeline import ScriptToDocPipeline, PipelineConfig, PipelineResult
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
-def test_phase1_e2e():
+# Replayed pipeline results, keyed by transcript + config + pipeline code
+CACHE_DIR = Path(__file__).parent / "test_output" / "cache" / "phase1"
+
+
+def get_code_fingerprint() -> str:
+    """Hash of the script_to_doc sources, prompts included."""
+    digest = hashlib.blake2b(digest_size=16)
+    package_dir = Path(script_to_doc.__file__).parent
+    for source_path in sorted(package_dir.glob("*.py")):
+        digest.update(source_path.name.encode())
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_cache_path(transcript_text: str, config: PipelineConfig) -> Path:
+    """
+    Content-addressed cache file for one transcript/config pair.
+
+    The key also covers the pipeline code, so editing a prompt or a stage
+    stops older results from replaying. Credential fields are left out so
+    rotating a key does not invalidate cached results.
+    """
+    settings = {k: v for k, v in asdict(config).items() if not k.endswith("_key")}
+    key = hashlib.blake2b(
+        (transcript_text + repr(settings) + get_code_fingerprint()).encode(), digest_size=16
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def save_cached_result(cache_path: Path, result: PipelineResult, output_path: Path):
+    """Store a pipeline result and its generated document, atomically."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "result": result.to_dict(),
+        "document": output_path.read_text() if output_path.exists() else None
+    }
+    tmp_path = cache_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(entry))
+    os.replace(tmp_path, cache_path)
+
+
+def load_cached_result(cache_path: Path, output_path: Path) -> PipelineResult:
+    """Restore a cached pipeline result and rewrite its document."""
+    entry = json.loads(cache_path.read_text())
+    if entry["document"] is not None:
+        output_path.write_text(entry["document"])
+    return PipelineResult(**entry["result"])
+
+
+def test_phase1_e2e(use_cache: bool = False):
     """
     Test full Phase 1 pipeline with Azure OpenAI.
 
     Process: sample_meeting.txt → Parse → Segment → Generate Steps → Document
+
+    Args:
+        use_cache: Replay a cached result for the same transcript, config and
+            pipeline code instead of calling Azure OpenAI again
     """
 
     print("=" * 80)
@@ -104,11 +167,19 @@ def test_phase1_e2e():
     print("=" * 80)
     print()
 
+    cache_path = get_cache_path(transcript_text, config)
+
     try:
-        result = pipeline.process(
-            transcript_text=transcript_text,
-            output_path=str(output_path)
-        )
+        if use_cache and cache_path.exists():
+            result = load_cached_result(cache_path, output_path)
+            print(f"✓ Replaying cached result: {cache_path.name} (run without --cache to call Azure OpenAI)")
+        else:
+            result = pipeline.process(
+                transcript_text=transcript_text,
+                output_path=str(output_path)
+            )
+            if result.success:
+                save_cached_result(cache_path, result, output_path)
 
         if not result.success:
             print(f"❌ Processing failed: {result.error}")
@@ -191,15 +262,14 @@ def test_phase1_e2e():
             print("=" * 80)
             print()
 
+            # Show first 30 lines, then count the rest without keeping them
             with open(output_path, 'r') as f:
-                doc_lines = f.readlines()
-
-            # Show first 30 lines
-            for i, line in enumerate(doc_lines[:30], 1):
-                print(line.rstrip())
+                for line in islice(f, 30):
+                    print(line.rstrip())
+                remaining_lines = sum(1 for _ in f)
 
-            if len(doc_lines) > 30:
-                print(f"\n... ({len(doc_lines) - 30} more lines)")
+            if remaining_lines:
+                print(f"\n... ({remaining_lines} more lines)")
             print()
 
         print("=" * 80)
@@ -220,7 +290,10 @@ def test_phase1_e2e():
 
 def main():
     """Run Phase 1 end-to-end test."""
-    exit_code = test_phase1_e2e()
+    if UVLOOP_AVAILABLE:
+        # The pipeline's parallel step generation runs on this loop
+        uvloop.install()
+    exit_code = test_phase1_e2e(use_cache="--cache" in sys.argv[1:])
     sys.exit(exit_code)
 
 
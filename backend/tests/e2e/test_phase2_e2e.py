@@ -13,6 +13,12 @@ sys.path.insert(0, str(backend_dir))
 
 from script_to_doc.pipeline import ScriptToDocPipeline, PipelineConfig
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 def test_phase2_e2e():
     """
@@ -273,5 +279,8 @@ def test_phase2_e2e():
 
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        # The pipeline's parallel step generation runs on this loop
+        uvloop.install()
     exit_code = test_phase2_e2e()
     sys.exit(exit_code)
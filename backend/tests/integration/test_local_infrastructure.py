@@ -0,0 +1,183 @@
+"""
+Local infrastructure integration tests.
+
+Covers the SQLite job store, filesystem blob storage, configuration,
+dependency injection and OpenAI client setup used in local mode.
+
+The database and storage tests run against temporary paths and need no
+configuration. The remaining tests read settings the same way the API
+does, so point them at the local config to exercise everything:
+
+    ENV_FILE=.env.local pytest tests/integration/test_local_infrastructure.py
+"""
+
+import math
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from script_to_doc.config import get_settings
+from script_to_doc.local_db import LocalDBClient
+from script_to_doc.local_storage import LocalBlobServiceClient
+
+PLACEHOLDER_OPENAI_KEY = "your-openai-api-key-here"
+
+
+@pytest.fixture(scope="module")
+def settings():
+    """Application settings, as loaded by the API."""
+    return get_settings()
+
+
+@pytest.fixture(scope="module")
+def local_settings(settings):
+    """Settings, skipping the test unless local mode is enabled."""
+    if not settings.use_local_mode:
+        pytest.skip("USE_LOCAL_MODE is not enabled (set ENV_FILE=.env.local)")
+    return settings
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Throwaway local job database."""
+    return LocalDBClient(str(tmp_path / "test_scripttodoc.db"), durable=False)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Throwaway local blob storage."""
+    return LocalBlobServiceClient(str(tmp_path / "test_storage"))
+
+
+def make_job(job_id: str = "test-job-001") -> dict:
+    """Build a queued test job record."""
+    now = datetime.utcnow().isoformat()
+    return {
+        'id': job_id,
+        'user_id': 'test-user',
+        'status': 'queued',
+        'progress': 0.0,
+        'stage': 'init',
+        'created_at': now,
+        'updated_at': now,
+        'config': {'tone': 'Professional'},
+        'input': {'filename': 'test.txt'}
+    }
+
+
+class TestDatabase:
+    """Tests for the SQLite job store."""
+
+    def test_job_lifecycle(self, db):
+        """Test create, read, update, query and delete of one job."""
+        test_job = make_job()
+        db.create_item(test_job)
+
+        result = db.read_item('test-job-001', 'test-user')
+        assert result['id'] == 'test-job-001'
+        assert result['status'] == 'queued'
+        assert result['config'] == {'tone': 'Professional'}
+
+        result['status'] = 'completed'
+        result['progress'] = 1.0
+        db.upsert_item(result)
+        assert db.read_item('test-job-001', 'test-user')['status'] == 'completed'
+
+        jobs = db.query_items(None, None, partition_key='test-user', max_item_count=10)
+        assert sum(1 for _ in jobs) == 1
+
+        db.delete_item('test-job-001', 'test-user')
+        jobs = db.query_items(None, None, partition_key='test-user', max_item_count=10)
+        assert sum(1 for _ in jobs) == 0
+
+    def test_bulk_delete(self, db):
+        """Test that delete_many removes every listed job."""
+        bulk_ids = [f'test-job-bulk-{i:03d}' for i in range(5)]
+        for job_id in bulk_ids:
+            db.create_item(make_job(job_id))
+
+        deleted = db.delete_many(bulk_ids, 'test-user')
+
+        assert deleted == len(bulk_ids), "Bulk delete should remove every test job"
+
+    def test_non_finite_floats_round_trip(self, db):
+        """Test that NaN and infinities in job data read back as floats."""
+        test_job = make_job()
+        test_job['result'] = {'confidence': float('nan'), 'scores': [float('inf'), -float('inf'), None]}
+        db.create_item(test_job)
+
+        result = db.read_item('test-job-001', 'test-user')['result']
+
+        assert math.isnan(result['confidence'])
+        assert result['scores'] == [float('inf'), -float('inf'), None]
+
+
+class TestStorage:
+    """Tests for filesystem blob storage."""
+
+    def test_blob_lifecycle(self, storage):
+        """Test upload, download, exists, URL, list and delete of one blob."""
+        blob_client = storage.get_blob_client('uploads', 'test-file.txt')
+        test_data = b'Hello from local storage!'
+        blob_client.upload_blob(test_data)
+
+        assert blob_client.download_blob().readall() == test_data
+        assert blob_client.exists(), "Blob should exist"
+        assert blob_client.url.startswith("file://"), "URL should be file:// in local mode"
+
+        container_client = storage.get_container_client('uploads')
+        blob_names = [blob['name'] for blob in container_client.list_blobs()]
+        assert blob_names == ['test-file.txt']
+
+        blob_client.delete_blob()
+        assert not blob_client.exists()
+
+
+class TestLocalMode:
+    """Tests that need USE_LOCAL_MODE enabled."""
+
+    def test_configuration(self, local_settings):
+        """Test that local configuration is loaded."""
+        assert local_settings.local_data_path
+
+    def test_dependency_injection(self, local_settings):
+        """Test that the API dependencies hand out local clients."""
+        from api.dependencies import get_cosmos_client, get_blob_service_client, get_service_bus_client
+
+        assert 'Local' in type(get_cosmos_client()).__name__, "Should be using local database client"
+        assert 'Local' in type(get_blob_service_client()).__name__, "Should be using local storage client"
+        assert get_service_bus_client() is None, "Service Bus client should be None in local mode"
+
+
+class TestOpenAIClient:
+    """Tests for OpenAI client setup in local mode."""
+
+    def test_openai_client_requires_key(self):
+        """Test that local mode refuses to start without an OpenAI key."""
+        from script_to_doc.azure_openai_client import AzureOpenAIClient
+
+        with pytest.raises(ValueError):
+            AzureOpenAIClient(use_local_mode=True, openai_api_key=None)
+
+    def test_openai_client(self, local_settings):
+        """Test OpenAI client initialization with the configured key."""
+        from script_to_doc.azure_openai_client import AzureOpenAIClient
+
+        api_key = local_settings.openai_api_key
+        if not api_key or api_key == PLACEHOLDER_OPENAI_KEY:
+            pytest.skip("OPENAI_API_KEY is not configured")
+
+        client = AzureOpenAIClient(
+            use_local_mode=True,
+            openai_api_key=api_key,
+            openai_model=local_settings.openai_model
+        )
+
+        assert client.openai_model == local_settings.openai_model
+        assert client.use_fallback
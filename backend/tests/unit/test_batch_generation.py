@@ -0,0 +1,159 @@
+"""
+Unit tests for Batch API step generation in AzureOpenAIClient.
+
+A fake client stands in for the OpenAI files/batches endpoints so the
+request building, polling and result parsing run without network access.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from script_to_doc import azure_openai_client
+from script_to_doc.azure_openai_client import AzureOpenAIClient
+
+
+def completion_line(custom_id: str, title: str, tokens: int) -> dict:
+    """Build one successful Batch API output line."""
+    content = f"STEP 1: {title}\nOVERVIEW: {title} overview\nKEY ACTIONS:\n- Click {title}"
+    return {
+        "custom_id": custom_id,
+        "response": {
+            "status_code": 200,
+            "body": {
+                "choices": [{"message": {"content": content}}],
+                "usage": {"prompt_tokens": tokens, "completion_tokens": 1, "total_tokens": tokens + 1}
+            }
+        },
+        "error": None
+    }
+
+
+class FakeBatchClient:
+    """Records Batch API calls and replays canned statuses and files."""
+
+    def __init__(self, statuses, output_lines, error_lines=()):
+        self.statuses = list(statuses)
+        self.uploaded = None
+        self.cancelled = []
+        self.contents = {
+            "output-file": "\n".join(json.dumps(line) for line in output_lines),
+            "error-file": "\n".join(json.dumps(line) for line in error_lines),
+        }
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(
+            create=self._create_batch,
+            retrieve=lambda batch_id: self._batch(),
+            cancel=self.cancelled.append
+        )
+        self.error_file_id = "error-file" if error_lines else None
+
+    def _create_file(self, file, purpose):
+        assert purpose == "batch"
+        self.uploaded = file[1].decode("utf-8")
+        return SimpleNamespace(id="input-file")
+
+    def _file_content(self, file_id):
+        return SimpleNamespace(text=self.contents[file_id])
+
+    def _create_batch(self, input_file_id, endpoint, completion_window):
+        assert input_file_id == "input-file"
+        assert completion_window == "24h"
+        self.endpoint = endpoint
+        return self._batch()
+
+    def _batch(self):
+        status = self.statuses.pop(0)
+        return SimpleNamespace(
+            id="batch-1",
+            status=status,
+            output_file_id="output-file" if status == "completed" else None,
+            error_file_id=self.error_file_id if status == "completed" else None
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Local-mode client whose polling sleeps are recorded, not slept."""
+    client = AzureOpenAIClient(use_local_mode=True, openai_api_key="sk-test")
+    client.sleeps = []
+    monkeypatch.setattr(azure_openai_client.time, "sleep", client.sleeps.append)
+    return client
+
+
+class TestBatchGeneration:
+    """Test Batch API step generation."""
+
+    def test_submits_one_request_per_chunk(self, client):
+        """Test that every chunk becomes one JSONL request line."""
+        fake = FakeBatchClient(["completed"], [completion_line("step-1", "Open", 5)])
+        client.client = fake
+
+        client.generate_steps_from_chunks_batch(["Open the portal."])
+
+        requests = [json.loads(line) for line in fake.uploaded.splitlines()]
+        assert [r["custom_id"] for r in requests] == ["step-1"]
+        assert requests[0]["url"] == fake.endpoint == "/v1/chat/completions"
+        assert requests[0]["body"]["model"] == client.openai_model
+        assert "Open the portal." in requests[0]["body"]["messages"][1]["content"]
+
+    def test_results_follow_chunk_order(self, client):
+        """Test that out-of-order results map back to their chunks."""
+        client.client = FakeBatchClient(
+            ["validating", "in_progress", "completed"],
+            [completion_line("step-2", "Deploy", 7), completion_line("step-1", "Create", 5)]
+        )
+
+        steps, usage, first_error = client.generate_steps_from_chunks_batch(["Create it.", "Deploy it."])
+
+        assert [step["title"] for step in steps] == ["Create", "Deploy"]
+        assert steps[0]["actions"] == ["Click Create"]
+        assert usage == {"input_tokens": 12, "output_tokens": 2, "total_tokens": 14}
+        assert first_error is None
+        assert client.sleeps == [5.0, 10.0]
+
+    def test_failed_requests_are_skipped(self, client):
+        """Test that a failed request drops its step and reports the error."""
+        error_line = {
+            "custom_id": "step-2",
+            "response": {"status_code": 429, "body": {"error": {"message": "rate limited"}}},
+            "error": None
+        }
+        client.client = FakeBatchClient(["completed"], [completion_line("step-1", "Create", 5)], [error_line])
+
+        steps, usage, first_error = client.generate_steps_from_chunks_batch(["Create it.", "Deploy it."])
+
+        assert [step["title"] for step in steps] == ["Create"]
+        assert "rate limited" in first_error
+
+    def test_failed_batch_raises(self, client):
+        """Test that a batch ending in a non-completed status raises."""
+        client.client = FakeBatchClient(["in_progress", "failed"], [])
+
+        with pytest.raises(RuntimeError, match="failed"):
+            client.generate_steps_from_chunks_batch(["Create it."])
+
+    def test_timeout_cancels_batch(self, client):
+        """Test that a batch still running at max_wait is cancelled."""
+        fake = FakeBatchClient(["in_progress"], [])
+        client.client = fake
+
+        with pytest.raises(TimeoutError):
+            client.generate_steps_from_chunks_batch(["Create it."], max_wait=0)
+
+        assert fake.cancelled == ["batch-1"]
+
+    def test_sdk_without_batches_is_rejected(self, client):
+        """Test that clients lacking the Batch API refuse batch generation."""
+        client.client = SimpleNamespace(files=None)
+
+        assert not client.supports_batch_api
+        with pytest.raises(RuntimeError, match="Batch API"):
+            client.generate_steps_from_chunks_batch(["Create it."])
@@ -0,0 +1,111 @@
+"""
+Unit tests for parallel step generation in ScriptToDocPipeline.
+
+A fake async client records how many step requests are in flight so the
+concurrency cap can be checked without network access.
+"""
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from script_to_doc.pipeline import ScriptToDocPipeline, PipelineConfig
+
+
+class FakeAsyncStepClient:
+    """Answers step requests after a short delay, tracking concurrency.
+
+    Even-numbered chunks take longer, so responses arrive out of chunk order.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_step_from_chunk_async(self, chunk, chunk_index, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02 if chunk_index % 2 == 0 else 0.01)
+        self.in_flight -= 1
+        if chunk_index == 2:
+            raise ValueError("step 2 failed")
+        step = {"title": f"Step {chunk_index}", "summary": chunk, "details": chunk, "actions": []}
+        return step, {"input_tokens": 10, "output_tokens": 2, "total_tokens": 12}
+
+
+def make_pipeline(**overrides) -> ScriptToDocPipeline:
+    """Build a local-mode pipeline with a fake step client."""
+    config = PipelineConfig(use_local_mode=True, openai_api_key="sk-test", **overrides)
+    pipeline = ScriptToDocPipeline(config)
+    pipeline.azure_openai = FakeAsyncStepClient()
+    return pipeline
+
+
+class TestParallelGeneration:
+    """Test bounded parallel step generation."""
+
+    def test_concurrency_is_capped(self):
+        """Test that no more than max_concurrent_requests calls overlap."""
+        pipeline = make_pipeline(max_concurrent_requests=3)
+        chunks = [f"Chunk {i}." for i in range(1, 11)]
+
+        asyncio.run(pipeline._generate_steps_parallel(chunks, None))
+
+        assert pipeline.azure_openai.max_in_flight == 3
+
+    def test_results_keep_chunk_order(self):
+        """Test that steps come back in chunk order with failures skipped."""
+        pipeline = make_pipeline()
+        chunks = [f"Chunk {i}." for i in range(1, 5)]
+
+        steps, usage, first_error = asyncio.run(pipeline._generate_steps_parallel(chunks, None))
+
+        assert [step["title"] for step in steps] == ["Step 1", "Step 3", "Step 4"]
+        assert usage == {"input_tokens": 30, "output_tokens": 6, "total_tokens": 36}
+        assert first_error == "step 2 failed"
+
+    def test_on_step_sees_steps_in_chunk_order(self):
+        """Test that on_step gets successful steps in chunk order as they complete."""
+        pipeline = make_pipeline()
+        chunks = [f"Chunk {i}." for i in range(1, 6)]
+        seen = []
+
+        asyncio.run(pipeline._generate_steps_parallel(chunks, None, on_step=seen.append))
+
+        assert [step["title"] for step in seen] == ["Step 1", "Step 3", "Step 4", "Step 5"]
+
+    def test_prefetched_sources_match_inline_sources(self):
+        """Test that sources found up front give the same step source data."""
+        sentences = [
+            "Open the Azure portal and sign in with your account.",
+            "Create a resource group in the Azure portal for the app.",
+            "Deploy the app into the new resource group."
+        ]
+        steps = [
+            {"title": "Create a resource group", "summary": "Create a resource group in the Azure portal.",
+             "details": "Open the Azure portal and create a resource group for the app.", "actions": []},
+            {"title": "Deploy the app", "summary": "Deploy the app into the resource group.",
+             "details": "Deploy the app from the Azure portal.", "actions": []}
+        ]
+        inline_manager = make_pipeline().source_manager
+        inline = [inline_manager.build_step_sources(i, step, sentences) for i, step in enumerate(steps, 1)]
+
+        pipeline = make_pipeline()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = [
+                executor.submit(pipeline.source_manager.find_sources_for_step_dict, step, sentences)
+                for step in steps
+            ]
+        reused = [
+            pipeline.source_manager.build_step_sources(i, step, sentences, sources=future.result())
+            for i, (step, future) in enumerate(zip(steps, futures), 1)
+        ]
+
+        assert [data.sources for data in reused] == [data.sources for data in inline]
+        assert [data.overall_confidence for data in reused] == [data.overall_confidence for data in inline]
+        assert inline[1].sources[0].confidence < inline[0].sources[0].confidence
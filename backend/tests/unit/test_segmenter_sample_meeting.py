@@ -42,7 +42,7 @@ def main():
 
     # Step 2: Segment into topics
     print("Step 2: Segmenting into topics...")
-    segmenter = TopicSegmenter()
+    segmenter = TopicSegmenter(SegmentationConfig(compute_coherence=True))
     segments = segmenter.segment(parsed_sentences, metadata)
     print(f"✓ Created {len(segments)} topic segments")
     print()
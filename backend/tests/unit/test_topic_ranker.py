@@ -7,6 +7,8 @@ Tests importance scoring and ranking logic.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend to path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
@@ -270,6 +272,56 @@ class TestScoreSegments:
         scores = self.ranker.score_segments([])
         assert len(scores) == 0
 
+    def test_iter_scores_matches_score_segments(self):
+        """Test that streaming scores match the materialized list."""
+        segments = [
+            TopicSegment(
+                segment_index=i,
+                sentences=[
+                    ParsedSentence(text=text, raw_text=text, sentence_index=i)
+                ],
+                coherence_score=0.5
+            )
+            for i, text in enumerate(["Click the button.", "We talked about it."])
+        ]
+
+        streamed = self.ranker.iter_scores(segments)
+
+        assert not isinstance(streamed, list)
+        assert list(streamed) == self.ranker.score_segments(segments)
+
+    def test_score_is_immutable(self):
+        """Test that TopicScore is a frozen, slotted dataclass."""
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[ParsedSentence(text="Click save.", raw_text="Click", sentence_index=0)]
+        )
+        score = self.ranker.score_segments([segment])[0]
+
+        assert not hasattr(score, "__dict__")
+        try:
+            score.importance_score = 1.0
+            assert False, "TopicScore should be frozen"
+        except AttributeError:
+            pass
+
+    def test_weighted_breakdown_sums_to_importance(self):
+        """Test that on-demand weighted scores add up to importance."""
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[ParsedSentence(text="Click save.", raw_text="Click", sentence_index=0)],
+            coherence_score=0.6
+        )
+        score = self.ranker.score_segments([segment])[0]
+        config = self.ranker.config
+
+        total = (
+            score.weighted_procedural(config) +
+            score.weighted_action_density(config) +
+            score.weighted_coherence(config)
+        )
+        assert abs(total - score.importance_score) < 1e-9
+
 
 class TestRankByImportance:
     """Test ranking segments by importance."""
@@ -425,6 +477,18 @@ class TestRankingReport:
         assert "max_importance" in report["statistics"]
         assert "min_importance" in report["statistics"]
 
+        stats = report["statistics"]
+        importances = [s["importance"] for s in report["scores"]]
+        assert stats["max_importance"] == pytest.approx(max(importances), abs=1e-3)
+        assert (
+            stats["high_importance_count"] +
+            stats["medium_importance_count"] +
+            stats["low_importance_count"]
+        ) == 2
+        assert all(isinstance(stats[k], int) for k in (
+            "high_importance_count", "medium_importance_count", "low_importance_count"
+        ))
+
     def test_get_ranking_report_empty(self):
         """Test ranking report with empty segment list."""
         report = self.ranker.get_ranking_report([])
@@ -3,11 +3,16 @@ Unit tests for topic segmentation.
 Tests boundary detection, segment creation, and quality metrics.
 """
 
+import numpy as np
 import pytest
 from script_to_doc.topic_segmenter import (
     TopicSegmenter,
     TopicSegment,
-    SegmentationConfig
+    SegmentationConfig,
+    SentenceArrays,
+    ROLE_UNKNOWN,
+    ROLE_INSTRUCTOR,
+    ROLE_PARTICIPANT
 )
 from script_to_doc.transcript_parser import ParsedSentence, TranscriptMetadata
 
@@ -123,6 +128,19 @@ class TestTopicSegment:
         assert segment.speaker_counts["Speaker 1"] == 2
         assert segment.speaker_counts["Speaker 2"] == 1
 
+    def test_primary_speaker_tie_goes_to_first_speaker(self):
+        """Test that a speaker-count tie picks the first speaker seen."""
+        sentences = [
+            ParsedSentence(text=text, raw_text=text, sentence_index=i, speaker=speaker)
+            for i, (text, speaker) in enumerate([
+                ("One", "Speaker 1"), ("Two", "Speaker 2"),
+                ("Three", "Speaker 2"), ("Four", "Speaker 1")
+            ])
+        ]
+
+        segment = TopicSegment(segment_index=0, sentences=sentences)
+        assert segment.primary_speaker == "Speaker 1"
+
     def test_segment_with_transition_start(self):
         """Test detection of transition at segment start."""
         sentences = [
@@ -179,6 +197,65 @@ class TestTopicSegment:
 
         assert text == "First sentence Second sentence Third sentence"
 
+    def test_segment_text_cached_until_recompute(self):
+        """Test that segment text is cached and refreshed by recompute_metadata()."""
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[ParsedSentence(text="First", raw_text="First", sentence_index=0)]
+        )
+        assert segment.text is segment.get_text()
+
+        segment.sentences = segment.sentences + [
+            ParsedSentence(text="Second", raw_text="Second", sentence_index=1)
+        ]
+        segment.recompute_metadata()
+        assert segment.get_text() == "First Second"
+
+    def test_segment_procedural_counts(self):
+        """Test procedural indicator counts are precomputed at construction."""
+        sentences = [
+            ParsedSentence(text="First, click the Save button", raw_text="", sentence_index=0),
+            ParsedSentence(text="Then select the file", raw_text="", sentence_index=1),
+            ParsedSentence(text="It should look fine", raw_text="", sentence_index=2)
+        ]
+
+        segment = TopicSegment(segment_index=0, sentences=sentences)
+
+        assert segment.action_verb_count == 3  # click, select, save
+        assert segment.sequence_count == 2     # first, then
+        assert segment.imperative_count == 2   # "first, click", "then select"
+
+    def test_recompute_metadata_after_in_place_change(self):
+        """Test recompute_metadata() refreshes derived fields after mutation."""
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[
+                ParsedSentence(text="Intro", raw_text="", sentence_index=0,
+                               timestamp=10.0, speaker="A")
+            ]
+        )
+        segment.sentences = segment.sentences + [
+            ParsedSentence(text="Any questions?", raw_text="", sentence_index=1,
+                           timestamp=40.0, speaker="B", speaker_role="participant",
+                           is_question=True),
+            ParsedSentence(text="Yes, how?", raw_text="", sentence_index=2,
+                           timestamp=50.0, speaker="B", speaker_role="participant",
+                           is_question=True)
+        ]
+        segment.recompute_metadata()
+
+        assert segment.duration_seconds == 40.0
+        assert segment.speaker_counts == {"A": 1, "B": 2}
+        assert segment.primary_speaker == "B"
+        assert segment.question_count == 2
+        assert segment.has_qa_section is True
+
+        segment.sentences = []
+        segment.recompute_metadata()
+        assert segment.start_timestamp is None
+        assert segment.speaker_counts == {}
+        assert segment.question_count == 0
+
 
 class TestBoundaryDetection:
     """Test topic boundary detection logic."""
@@ -310,6 +387,25 @@ class TestBoundaryDetection:
         score = segmenter._compute_semantic_similarity_score(prev_sent, curr_sent)
         assert score > 0.5  # Low similarity = high boundary score
 
+    def test_semantic_similarity_ignores_punctuation(self):
+        """Test that keywords match regardless of surrounding punctuation."""
+        config = SegmentationConfig(use_semantic_similarity=True)
+        segmenter = TopicSegmenter(config)
+
+        prev_sent = ParsedSentence(
+            text="Open the portal settings.",
+            raw_text="Open the portal settings.",
+            sentence_index=0
+        )
+        curr_sent = ParsedSentence(
+            text="(Portal) settings, open!",
+            raw_text="(Portal) settings, open!",
+            sentence_index=1
+        )
+
+        score = segmenter._compute_semantic_similarity_score(prev_sent, curr_sent)
+        assert score == 0.0  # Identical keyword sets
+
     def test_is_topic_boundary_above_threshold(self):
         """Test boundary detection with score above threshold."""
         sent = ParsedSentence(text="Test", raw_text="Test", sentence_index=0)
@@ -329,6 +425,104 @@ class TestBoundaryDetection:
         # Even with low score, long pause creates boundary
         assert self.segmenter._is_topic_boundary(0.1, sent) is True
 
+    def test_vectorized_scores_match_pairwise(self):
+        """Test that batched boundary scores match the per-pair computation."""
+        sentences = [
+            ParsedSentence(text="Open the portal", raw_text="", sentence_index=0,
+                           timestamp=0.0, speaker="A", speaker_role="instructor"),
+            ParsedSentence(text="How do I log in?", raw_text="", sentence_index=1,
+                           timestamp=20.0, speaker="B", speaker_role="participant",
+                           speaker_changed=True, is_question=True),
+            ParsedSentence(text="Now let's configure settings", raw_text="", sentence_index=2,
+                           timestamp=130.0, speaker="A", speaker_role="instructor",
+                           speaker_changed=True, is_transition=True, follows_long_pause=True),
+            ParsedSentence(text="Click save", raw_text="", sentence_index=3),
+            ParsedSentence(text="Next, review the report", raw_text="", sentence_index=4,
+                           timestamp=140.0, is_transition=True)
+        ]
+
+        for use_semantic in (False, True):
+            segmenter = TopicSegmenter(SegmentationConfig(use_semantic_similarity=use_semantic))
+            batched = segmenter._compute_boundary_scores(sentences)
+            pairwise = [
+                segmenter._compute_boundary_score(sentences[i - 1], sentences[i])
+                for i in range(1, len(sentences))
+            ]
+            assert batched.tolist() == pairwise
+
+            expected = [0] + [
+                i for i in range(1, len(sentences))
+                if segmenter._is_topic_boundary(pairwise[i - 1], sentences[i])
+            ]
+            assert segmenter._identify_boundaries(sentences) == expected
+
+    def test_sentence_arrays_factorize_speakers(self):
+        """Test that speakers and roles are encoded as small integers."""
+        sentences = [
+            ParsedSentence(text=str(i), raw_text="", sentence_index=i, speaker=speaker, speaker_role=role)
+            for i, (speaker, role) in enumerate([
+                ("Ann", "instructor"), ("Bob", "participant"), ("Ann", "instructor"), (None, None)
+            ])
+        ]
+
+        arrays = SentenceArrays.from_sentences(sentences)
+
+        assert arrays.speaker_id.tolist() == [0, 1, 0, -1]
+        assert arrays.speaker_role.tolist() == [
+            ROLE_INSTRUCTOR, ROLE_PARTICIPANT, ROLE_INSTRUCTOR, ROLE_UNKNOWN
+        ]
+
+    def test_sentence_arrays_match_sentence_attributes(self):
+        """Test that SentenceArrays mirrors the per-sentence boundary fields."""
+        sentences = [
+            ParsedSentence(text="Intro", raw_text="", sentence_index=0, timestamp=0.0,
+                           follows_long_pause=True),
+            ParsedSentence(text="Question", raw_text="", sentence_index=1, speaker="B",
+                           speaker_changed=True, follows_long_pause=True),
+            ParsedSentence(text="Next step", raw_text="", sentence_index=2, timestamp=130.0,
+                           follows_long_pause=True, is_transition=True)
+        ]
+
+        arrays = SentenceArrays.from_sentences(sentences)
+
+        assert np.isnan(arrays.timestamps[1])
+        assert arrays.is_transition.tolist() == [False, False, True]
+        assert arrays.has_speaker.tolist() == [False, True, False]
+        assert arrays.speaker_id.tolist() == [-1, 0, -1]
+        # Only a truthy timestamp lets a long pause force a boundary
+        assert arrays.pause_override.tolist() == [
+            bool(s.follows_long_pause and s.timestamp) for s in sentences
+        ]
+
+    def test_semantic_signal_skipped_when_decided(self, monkeypatch):
+        """Test that keyword similarity only runs when it can flip the decision."""
+        segmenter = TopicSegmenter(SegmentationConfig(use_semantic_similarity=True))
+        calls = []
+        original = segmenter._compute_semantic_similarity_score
+
+        def counting(prev_sent, curr_sent, *keywords):
+            calls.append(curr_sent.sentence_index)
+            return original(prev_sent, curr_sent, *keywords)
+
+        monkeypatch.setattr(segmenter, "_compute_semantic_similarity_score", counting)
+
+        sentences = [
+            ParsedSentence(text="Open the portal", raw_text="", sentence_index=0, timestamp=0.0),
+            # Long pause + transition: boundary regardless of similarity
+            ParsedSentence(text="Now let's configure settings", raw_text="", sentence_index=1,
+                           timestamp=200.0, follows_long_pause=True, is_transition=True),
+            # Near-silent pair: 0.10 semantic weight cannot reach the 0.40 threshold
+            ParsedSentence(text="Can I save?", raw_text="", sentence_index=2, timestamp=205.0,
+                           speaker="B", speaker_role="participant"),
+            # Instructor resumes after 31s (~0.37): semantic weight decides
+            ParsedSentence(text="Review the report", raw_text="", sentence_index=3,
+                           timestamp=236.0, speaker="A", speaker_role="instructor",
+                           speaker_changed=True)
+        ]
+
+        segmenter._identify_boundaries(sentences)
+        assert calls == [3]
+
 
 class TestSegmentation:
     """Test full segmentation workflow."""
@@ -511,6 +705,26 @@ class TestSegmentation:
         assert len(segments[0].sentences) == 5  # 3 + 2
         assert len(segments[1].sentences) == 3
 
+    def test_merge_does_not_mutate_input_sentence_lists(self):
+        """Test that merging extends a private copy of the kept segment's sentences."""
+        segmenter = TopicSegmenter(SegmentationConfig(min_segment_sentences=2))
+        first = [
+            ParsedSentence(text="A1", raw_text="A1", sentence_index=0),
+            ParsedSentence(text="A2", raw_text="A2", sentence_index=1)
+        ]
+        segments = [
+            TopicSegment(segment_index=0, sentences=first),
+            TopicSegment(segment_index=1, sentences=[ParsedSentence(text="B1", raw_text="B1", sentence_index=2)]),
+            TopicSegment(segment_index=2, sentences=[ParsedSentence(text="C1", raw_text="C1", sentence_index=3)])
+        ]
+
+        merged = segmenter._merge_small_segments(segments)
+
+        assert len(merged) == 1
+        assert [s.text for s in merged[0].sentences] == ["A1", "A2", "B1", "C1"]
+        assert merged[0].get_text() == "A1 A2 B1 C1"
+        assert len(first) == 2
+
     def test_no_merge_when_disabled(self):
         """Test that merging can be disabled."""
         config = SegmentationConfig(
@@ -605,6 +819,132 @@ class TestSegmentMetrics:
         score = segmenter._compute_segment_coherence(segment)
         assert score < 0.5  # Should have low coherence (different topics)
 
+    def test_coherence_kernel_matches_set_path(self, monkeypatch):
+        """Test that the packed-array kernel matches the set-based computation."""
+        from script_to_doc import topic_segmenter
+
+        segmenter = TopicSegmenter()
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[
+                ParsedSentence(text=text, raw_text=text, sentence_index=i)
+                for i, text in enumerate([
+                    "Configure Azure portal settings",
+                    "ok",
+                    "Azure portal configuration requires authentication",
+                    "Complete portal setup with authentication settings"
+                ])
+            ]
+        )
+
+        expected = segmenter._compute_segment_coherence(segment)
+
+        # Exercise the kernel even when numba is not installed (pure Python)
+        monkeypatch.setattr(topic_segmenter, "NUMBA_AVAILABLE", True)
+        assert segmenter._compute_segment_coherence(segment) == pytest.approx(expected)
+
+        monkeypatch.setattr(topic_segmenter, "NUMBA_AVAILABLE", False)
+        assert segmenter._compute_segment_coherence(segment) == pytest.approx(expected)
+
+    def test_minhash_coherence_for_long_segments(self):
+        """Test that long segments use a deterministic estimate close to exact coherence."""
+        topics = [
+            ["azure", "portal", "resource", "group", "subscription"],
+            ["network", "subnet", "firewall", "address", "gateway"]
+        ]
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[
+                ParsedSentence(
+                    text=" ".join(topics[i % 2][j] for j in range(5) if (i + j) % 3),
+                    raw_text="", sentence_index=i
+                )
+                for i in range(80)
+            ]
+        )
+
+        exact = TopicSegmenter(SegmentationConfig(exact_coherence_max_sentences=1000))
+        estimated = TopicSegmenter(SegmentationConfig(exact_coherence_max_sentences=32))
+
+        estimate = estimated._compute_segment_coherence(segment)
+        assert estimate == estimated._compute_segment_coherence(segment)
+        assert estimate == pytest.approx(exact._compute_segment_coherence(segment), abs=0.05)
+
+    def test_exact_coherence_cutoff_is_fixed(self, monkeypatch):
+        """Test that the exact/estimate cutoff and scores do not depend on numba."""
+        from script_to_doc import topic_segmenter
+
+        assert topic_segmenter.DEFAULT_EXACT_COHERENCE_MAX_SENTENCES == 256
+        assert SegmentationConfig().exact_coherence_max_sentences == 256
+
+        words = ["azure", "portal", "resource", "group", "network", "subnet", "firewall", "gateway"]
+        segment = TopicSegment(
+            segment_index=0,
+            sentences=[
+                ParsedSentence(
+                    text=" ".join(words[(i + j) % len(words)] for j in range(i % 4 + 2)),
+                    raw_text="", sentence_index=i
+                )
+                for i in range(100)
+            ]
+        )
+
+        scores = []
+        for numba_available in (True, False):
+            monkeypatch.setattr(topic_segmenter, "NUMBA_AVAILABLE", numba_available)
+            scores.append(TopicSegmenter()._compute_segment_coherence(segment))
+
+        assert scores[0] == pytest.approx(scores[1])
+
+    def test_coherence_skipped_unless_enabled(self):
+        """Test that segment coherence is only scored when compute_coherence is set."""
+        sentences = [
+            ParsedSentence(text=text, raw_text=text, sentence_index=i)
+            for i, text in enumerate([
+                "Configure Azure portal settings", "Azure portal settings page",
+                "Save portal settings", "Portal settings saved"
+            ])
+        ]
+        config = dict(min_segment_sentences=1, min_total_segments=1)
+
+        default = TopicSegmenter(SegmentationConfig(**config)).segment(sentences)
+        enabled = TopicSegmenter(SegmentationConfig(compute_coherence=True, **config)).segment(sentences)
+
+        assert all(seg.coherence_score == 0.0 for seg in default)
+        assert all(seg.coherence_score > 0.0 for seg in enabled)
+
+    def test_keywords_extracted_once_per_sentence(self, monkeypatch):
+        """Test that boundary scoring and coherence share one keyword pass."""
+        from script_to_doc import topic_segmenter
+
+        texts = [
+            "Open the Azure portal dashboard", "Select the resource group",
+            "Configure network settings carefully", "Review deployment settings",
+            "Deployment validation takes minutes", "Confirm the deployment finished"
+        ]
+        sentences = [
+            ParsedSentence(text=text, raw_text=text, sentence_index=i, timestamp=i * 20.0)
+            for i, text in enumerate(texts)
+        ]
+        segmenter = TopicSegmenter(SegmentationConfig(
+            use_semantic_similarity=True, min_segment_sentences=2, min_total_segments=1,
+            compute_coherence=True
+        ))
+        expected = [seg.coherence_score for seg in segmenter.segment(sentences)]
+
+        extracted = []
+        original = topic_segmenter._keywords_for
+
+        def counting(text):
+            extracted.append(text)
+            return original(text)
+
+        monkeypatch.setattr(topic_segmenter, "_keywords_for", counting)
+        segments = segmenter.segment(sentences)
+
+        assert sorted(extracted) == sorted(texts)
+        assert [seg.coherence_score for seg in segments] == expected
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -0,0 +1,303 @@
+"""
+Unit tests for transcript cleaning.
+
+Tests noise removal (timestamps, speaker labels, tags, fillers) and normalization.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from script_to_doc.transcript_cleaner import (
+    TranscriptCleaner, SentenceTokenizer, TranscriptChunker, get_sentence_tokenizer
+)
+
+
+class TestTranscriptCleaner:
+    """Test individual cleaning steps."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cleaner = TranscriptCleaner()
+
+    def test_remove_timestamps(self):
+        """Test that all supported timestamp formats are removed."""
+        text = "[00:15:32] Open (00:15:33.120) the <00:15:34> portal 00:15:35 - now"
+        assert self.cleaner.remove_timestamps(text) == " Open  the  portal now"
+
+    def test_remove_speaker_labels_per_line(self):
+        """Test that speaker labels are removed at the start of each line."""
+        text = "Speaker 1: Open the portal\n[John]: Click save\n>> Speaker 2: Done"
+        assert self.cleaner.remove_speaker_labels(text) == "Open the portal\nClick save\nDone"
+
+    def test_remove_speaker_labels_stays_on_its_line(self):
+        """Test that stacked labels are removed but line breaks are never consumed."""
+        assert self.cleaner.remove_speaker_labels("John: [Mary]: Open\nSpeaker\n1: x") == "Open\nSpeaker\n1: x"
+        assert self.cleaner.remove_speaker_labels("John:\n\nClick save") == "\n\nClick save"
+
+    def test_remove_transcriber_tags_preserves_visual_markers(self):
+        """Test that noise tags are removed but visual markers are kept."""
+        text = "Open [inaudible] the portal [screen shows dashboard] (laughs) now [Slide 3]"
+        assert self.cleaner.remove_transcriber_tags(text) == (
+            "Open  the portal [screen shows dashboard]  now [Slide 3]"
+        )
+
+    def test_remove_transcriber_tags_inside_visual_marker(self):
+        """Test that known tags are stripped before visual markers are matched."""
+        text = "[slide [inaudible] overview] (LAUGHS) [Diagram: flow]"
+        assert self.cleaner.remove_transcriber_tags(text) == "[slide  overview]  [Diagram: flow]"
+
+    def test_remove_filler_words(self):
+        """Test single- and multi-word fillers are removed on word boundaries."""
+        text = "Um you know, open the portal. I mean it's likely OK"
+        assert self.cleaner.remove_filler_words(text) == " , open the portal.  it's likely "
+
+    def test_filler_words_sharing_prefixes(self):
+        """Test that the longest whole-word filler wins among shared prefixes."""
+        cleaner = TranscriptCleaner(custom_filler_words=["you", "You know what", "umm"])
+        text = "You know what, you know it, umm um ummm yours"
+        assert cleaner.remove_filler_words(text) == ",  it,   ummm yours"
+
+    def test_filler_words_can_be_changed_after_init(self):
+        """Test that edits to filler_words take effect on the next call."""
+        cleaner = TranscriptCleaner(custom_filler_words=["Hmm"])
+        assert cleaner.remove_filler_words("hmm open") == " open"
+
+        cleaner.filler_words.discard("hmm")
+        cleaner.filler_words.add("open")
+        assert cleaner.remove_filler_words("hmm open") == "hmm "
+
+    def test_remove_repetitive_templates(self):
+        """Test that template phrases are removed case-insensitively."""
+        text = "As I mentioned earlier, click save. We'll get back to this later."
+        assert self.cleaner.remove_repetitive_templates(text) == ", click save. ."
+
+    def test_remove_fillers_and_templates_matches_sequential(self):
+        """Test that the fused scan matches removing fillers, then templates."""
+        text = (
+            "Okay so, let's move on. Like I said, um, click save. Alright so "
+            "as we mentioned before you know the portal. We'll get back to this later"
+        )
+        sequential = self.cleaner.remove_repetitive_templates(self.cleaner.remove_filler_words(text))
+        assert self.cleaner.remove_fillers_and_templates(text) == sequential
+
+        self.cleaner.filler_words.clear()
+        assert self.cleaner.remove_fillers_and_templates(text) == self.cleaner.remove_repetitive_templates(text)
+
+    def test_detect_and_merge_duplicates(self):
+        """Test that near-identical sentences are dropped, keeping the first."""
+        text = "Open the Azure portal. Click save. open the azure portal. Open the Azure portals"
+        assert self.cleaner.detect_and_merge_duplicates(text) == "Open the Azure portal. Click save"
+
+    def test_detect_and_merge_duplicates_threshold_bounds(self):
+        """Test length prefiltering at the extremes of the similarity threshold."""
+        text = "Open the portal. Click save. Open the portal"
+        assert self.cleaner.detect_and_merge_duplicates(text, similarity_threshold=0.0) == "Open the portal"
+        assert self.cleaner.detect_and_merge_duplicates(text, similarity_threshold=1.0) == "Open the portal. Click save"
+        assert self.cleaner.detect_and_merge_duplicates(text, similarity_threshold=1.5) == text
+
+    def test_long_input_dedup_matches_pairwise(self, monkeypatch):
+        """Test that the MinHash-bucketed path finds the same duplicates as all-pairs."""
+        import random
+        from script_to_doc import transcript_cleaner
+
+        rng = random.Random(5)
+        words = ["open", "azure", "portal", "select", "resource", "group", "configure",
+                 "network", "settings", "review", "deployment", "region", "create", "subnet"]
+        sentences = []
+        for _ in range(80):
+            sentence = " ".join(rng.choice(words) for _ in range(rng.randint(5, 12)))
+            sentences.append(sentence)
+            if rng.random() < 0.3:
+                sentences.append(sentence.upper() if rng.random() < 0.5 else sentence + "s")
+        text = ". ".join(sentences)
+
+        bucketed = self.cleaner.detect_and_merge_duplicates(text)
+        monkeypatch.setattr(transcript_cleaner, "_DEDUP_LSH_MIN_SENTENCES", len(sentences) + 1)
+        pairwise = self.cleaner.detect_and_merge_duplicates(text)
+
+        assert bucketed == pairwise
+        assert len(bucketed.split(". ")) < len(sentences)
+
+    def test_minhash_signatures_independent_of_block_size(self, monkeypatch):
+        """Test that hashing texts in blocks gives the same signatures as one pass."""
+        from script_to_doc import transcript_cleaner
+
+        texts = [f"step {i} open the azure portal" for i in range(10)] + ["ok", "x"]
+
+        blocked = transcript_cleaner._minhash_signatures(texts)
+        monkeypatch.setattr(transcript_cleaner, "_DEDUP_SIGNATURE_BLOCK", 3)
+        assert (transcript_cleaner._minhash_signatures(texts) == blocked).all()
+        monkeypatch.setattr(transcript_cleaner, "_DEDUP_SIGNATURE_BLOCK", 1)
+        assert (transcript_cleaner._minhash_signatures(texts) == blocked).all()
+        assert blocked.shape == (len(texts), len(transcript_cleaner._DEDUP_MINHASH_SEEDS))
+
+    def test_exact_repeats_skip_fuzzy_comparison(self, monkeypatch):
+        """Test that looped captions are dropped without difflib comparisons."""
+        from script_to_doc import transcript_cleaner
+
+        calls = []
+        real_is_similar = transcript_cleaner._is_similar
+        monkeypatch.setattr(
+            transcript_cleaner, "_is_similar",
+            lambda matcher, threshold: calls.append(1) or real_is_similar(matcher, threshold)
+        )
+        captions = ["Open the portal", "Click save", "Select the resource group"]
+
+        for loops in (3, 30):
+            calls.clear()
+            text = ". ".join(captions * loops)
+            assert self.cleaner.detect_and_merge_duplicates(text) == ". ".join(captions)
+            assert len(calls) <= len(captions) ** 2
+
+    def test_similarity_prefilters_match_ratio(self, monkeypatch):
+        """Test that upper-bound rejection never changes the difflib decision."""
+        import difflib
+        from script_to_doc import transcript_cleaner
+
+        pairs = [
+            ("open the azure portal", "open the azure portals"),
+            ("click save", "select the resource group"),
+            ("aac caaa acb ca abbabcc", "aac caaa acb ca abbabcb"),
+        ]
+        for available in (True, False):
+            monkeypatch.setattr(transcript_cleaner, "RAPIDFUZZ_AVAILABLE",
+                                available and transcript_cleaner.RAPIDFUZZ_AVAILABLE)
+            for a, b in pairs:
+                ratio = difflib.SequenceMatcher(None, a, b).ratio()
+                for threshold in (ratio, ratio + 1e-12, 0.5, 0.9, 1.0):
+                    matcher = difflib.SequenceMatcher(None, a, b)
+                    assert transcript_cleaner._is_similar(matcher, threshold) == (ratio >= threshold)
+
+    def test_remove_webvtt_artifacts(self):
+        """Test that WEBVTT headers, notes and voice tags are removed."""
+        text = "WEBVTT\nNOTE generated\n<v Roger>Open the portal</v>"
+        assert self.cleaner.remove_webvtt_artifacts(text) == "Open the portal"
+
+    def test_remove_webvtt_artifacts_is_case_insensitive(self):
+        """Test that marker gating matches the case-insensitive patterns."""
+        assert self.cleaner.remove_webvtt_artifacts("webvtt\nnote draft\nOpen the portal") == "Open the portal"
+        assert self.cleaner.remove_webvtt_artifacts("Open the portal\nClick save") == "Open the portal\nClick save"
+
+    def test_normalize_whitespace(self):
+        """Test that space runs collapse and blank-line runs become one paragraph break."""
+        text = "  Open     the  portal \n\n\n\n\n  Click save  "
+        assert self.cleaner.normalize_whitespace(text) == "Open the portal\n\nClick save"
+
+    def test_fix_punctuation(self):
+        """Test spacing and repeated punctuation fixes."""
+        assert self.cleaner.fix_punctuation("Open it .Then save!!! Done,next") == (
+            "Open it. Then save! Done, next"
+        )
+
+    def test_fix_punctuation_guards(self):
+        """Test mixed and space-separated runs, and text with no punctuation."""
+        assert self.cleaner.fix_punctuation("Really?! Done . .") == "Really! Done."
+        assert self.cleaner.fix_punctuation("no marks here") == "no marks here"
+
+    def test_normalize_pipeline(self):
+        """Test the full cleaning pipeline on a noisy transcript."""
+        text = (
+            "WEBVTT\n\n[00:00:01]\nSpeaker 1: Um open the portal.\n\n\n\n"
+            "Speaker 1: Click   save [inaudible]."
+        )
+        assert self.cleaner.normalize(text) == "open the portal.\n\nClick save."
+
+
+class TestSimpleTokenizer:
+    """Test the regex fallback sentence tokenizer."""
+
+    def setup_method(self):
+        """Set up test fixtures (skips NLTK setup; only the fallback is tested)."""
+        self.tokenizer = SentenceTokenizer.__new__(SentenceTokenizer)
+
+    def test_splits_before_capitalized_sentences(self):
+        """Test splitting on end punctuation followed by whitespace and a capital."""
+        text = "Open the portal. Click save!! Is it done?  yes it is. Version 3.5 works"
+        assert self.tokenizer._simple_tokenize(text) == [
+            "Open the portal.", "Click save!!", "Is it done?  yes it is.", "Version 3.5 works"
+        ]
+
+    def test_empty_and_whitespace_only(self):
+        """Test that no empty sentences are returned."""
+        assert self.tokenizer._simple_tokenize("") == []
+        assert self.tokenizer._simple_tokenize("Done.   ") == ["Done."]
+
+
+class TestSentenceTokenizer:
+    """Test SentenceTokenizer caching."""
+
+    def test_tokenize_is_cached_per_text(self):
+        """Test that repeated tokenization of the same text reuses the result."""
+        tokenizer = SentenceTokenizer()
+        calls = []
+
+        def counting(text):
+            calls.append(text)
+            return tokenizer._simple_tokenize(text)
+
+        tokenizer.tokenizer = counting
+        text = "Open the portal. Click save. Ok."
+
+        first = tokenizer.tokenize(text)
+        first.append("mutated")
+        assert tokenizer.tokenize(text) == ["Open the portal.", "Click save."]
+        assert calls == [text]
+
+    def test_punkt_model_is_loaded_once(self, monkeypatch):
+        """Test that the Punkt model is loaded once and a missing model falls back to regex."""
+        import nltk
+        from script_to_doc import transcript_cleaner
+
+        class FakePunkt:
+            def tokenize(self, text):
+                return [text]
+
+        loads = []
+        monkeypatch.setattr(transcript_cleaner, "_punkt_tokenizer", None)
+        monkeypatch.setattr(nltk.data, "find", lambda resource: resource)
+        monkeypatch.setattr(nltk.data, "load", lambda resource: loads.append(resource) or FakePunkt())
+
+        first, second = SentenceTokenizer(), SentenceTokenizer()
+        assert first.tokenize("Open the portal. Click save.") == ["Open the portal. Click save."]
+        assert second.tokenize("Select the group.") == ["Select the group."]
+        assert loads == ["tokenizers/punkt/english.pickle"]
+
+        def missing(resource):
+            raise LookupError(resource)
+
+        monkeypatch.setattr(transcript_cleaner, "_punkt_tokenizer", None)
+        monkeypatch.setattr(nltk.data, "load", missing)
+        monkeypatch.setattr(nltk, "download", lambda *args, **kwargs: False)
+        assert SentenceTokenizer().tokenize("Open the portal. Click save.") == [
+            "Open the portal.", "Click save."
+        ]
+
+    def test_shared_tokenizer_is_created_once(self):
+        """Test that chunkers share one tokenizer unless given their own."""
+        assert get_sentence_tokenizer() is get_sentence_tokenizer()
+        assert TranscriptChunker().tokenizer is get_sentence_tokenizer()
+
+        own = SentenceTokenizer()
+        assert TranscriptChunker(own).tokenizer is own
+
+
+class TestTranscriptChunker:
+    """Test TranscriptChunker strategy selection."""
+
+    def test_chunk_smart_skips_paragraphs_when_too_few(self, monkeypatch):
+        """Test that too few paragraph breaks go straight to sentence chunking."""
+        chunker = TranscriptChunker()
+        calls = []
+        monkeypatch.setattr(chunker, "chunk_by_paragraphs", lambda *args: calls.append(args) or [])
+        monkeypatch.setattr(chunker, "chunk_by_sentences", lambda text, target: ["by sentences"])
+        text = "Open the portal. Click save.\n\nSelect the group. Review the settings."
+
+        assert chunker.chunk_smart(text, target_chunks=4) == ["by sentences"]
+        assert calls == []
+
+        assert chunker.chunk_smart(text, target_chunks=3) == ["by sentences"]
+        assert calls == [(text, 3)]
@@ -49,6 +49,14 @@ class TestTimestampExtraction:
         assert timestamp == 4530.0  # 1 hour 15 min 30 sec
         assert text == "Text"
 
+    def test_format_priority_and_milliseconds(self):
+        """Test later formats and millisecond suffixes read the right groups."""
+        assert self.parser._extract_timestamp("(00:02:30.250) Text") == (150, "Text")
+        assert self.parser._extract_timestamp("<00:00:15 Text") == (15, "Text")
+        assert self.parser._extract_timestamp("1:00:05.999 - Text") == (3605, "Text")
+        assert self.parser._extract_timestamp("00:10:00 Text") == (600, "Text")
+        assert self.parser._extract_timestamp("00:10:00") == (None, "00:10:00")
+
 
 class TestSpeakerExtraction:
     """Test speaker extraction in various formats."""
@@ -130,6 +138,13 @@ class TestQuestionDetection:
         """Test non-question sentences."""
         assert not self.parser._is_question("This is a statement")
         assert not self.parser._is_question("Navigate to the portal")
+
+    def test_question_word_must_be_whole_first_word(self):
+        """Test that a question word only counts when followed by a space or alone."""
+        assert self.parser._is_question("  Which ")
+        assert self.parser._is_question("DOES it scale")
+        assert not self.parser._is_question("Whatever you prefer")
+        assert not self.parser._is_question("What's next")
         assert not self.parser._is_question("Click the button")
 
 
@@ -165,6 +180,25 @@ class TestTransitionDetection:
         assert not self.parser._is_transition("This is a regular instruction")
 
 
+    def test_first_letter_guard_covers_all_phrases(self):
+        """Test that every phrase's first letter is in TRANSITION_FIRST_LETTERS."""
+        for phrase in TranscriptParser.TRANSITION_PHRASES:
+            body = phrase[len(r'\b'):]
+            if body.startswith('(?:'):
+                words = body[len('(?:'):body.index(')')].split('|')
+            else:
+                words = [body]
+            for word in words:
+                assert word[0] in TranscriptParser.TRANSITION_FIRST_LETTERS, phrase
+
+    def test_case_folding_ascii_and_unicode(self):
+        """Test that lowercased ASCII and IGNORECASE Unicode paths agree."""
+        assert self.parser._is_transition("NEXT, WE'LL OPEN THE PORTAL")
+        assert self.parser._is_transition("Moving On to the café")
+        assert self.parser._is_transition("ſo, let's begin")  # long s folds to "s"
+        assert not self.parser._is_transition("Café menu")
+
+
 class TestEmphasisDetection:
     """Test emphasis marker detection."""
 
@@ -191,6 +225,7 @@ class TestEmphasisDetection:
         """Test normal text without emphasis."""
         assert not self.parser._has_emphasis("This is normal text")
         assert not self.parser._has_emphasis("A sentence without any emphasis")
+        assert not self.parser._has_emphasis("Keep snake_case names")
 
 
 class TestFullParsing:
@@ -363,6 +398,84 @@ Normal text without any format"""
         assert len(first.text) > 1000
 
 
+class TestMetadata:
+    """Test transcript-level metadata built from parsed sentences."""
+
+    def test_primary_speaker_tie_goes_to_first_speaker(self):
+        """Test that equal sentence counts pick the speaker heard first."""
+        parser = TranscriptParser()
+        speakers = ["Bob", "Alice", "Alice", "Bob", None]
+        sentences = [
+            ParsedSentence(text="Open it.", raw_text="Open it.", sentence_index=i, speaker=speaker)
+            for i, speaker in enumerate(speakers)
+        ]
+
+        metadata = parser._build_metadata(sentences)
+
+        assert metadata.primary_speaker == "Bob"
+        assert metadata.primary_speaker_ratio == 0.4
+        assert [s.speaker_role for s in sentences] == [
+            "instructor", "participant", "participant", "instructor", None
+        ]
+        assert not metadata.has_qa_sections
+
+    def test_qa_sections_need_a_participant_question(self):
+        """Test Q&A detection against instructor, participant and unattributed questions."""
+        parser = TranscriptParser()
+
+        def sentences(*rows):
+            return [
+                ParsedSentence(text="Why?", raw_text="Why?", sentence_index=i,
+                               speaker=speaker, is_question=is_question, speaker_role=role)
+                for i, (speaker, is_question, role) in enumerate(rows)
+            ]
+
+        instructor_only = sentences(("Bob", True, None), ("Bob", False, None), ("Alice", False, None))
+        assert not parser._build_metadata(instructor_only).has_qa_sections
+
+        participant = sentences(("Bob", False, None), ("Bob", False, None), ("Alice", True, None))
+        assert parser._build_metadata(participant).has_qa_sections
+
+        unattributed = sentences(("Bob", False, None), (None, True, "participant"))
+        assert parser._build_metadata(unattributed).has_qa_sections
+
+
+class TestClassificationCache:
+    """Test per-text caching of sentence classification."""
+
+    def test_repeated_sentences_are_classified_once(self):
+        """Test that repeated short replies reuse the cached classification."""
+        parser = TranscriptParser()
+        calls = []
+        real_is_question = parser._is_question
+        parser._is_question = lambda text: calls.append(text) or real_is_question(text)
+
+        texts = ["Yeah.", "Can you click SAVE", "Yeah.", "Moving on, open it.", "Yeah."]
+        sentences = [{'text': t, 'timestamp': None, 'speaker': None, 'raw': t} for t in texts]
+        parsed = parser._analyze_sentences(sentences)
+
+        assert calls == ["Yeah.", "Can you click SAVE", "Moving on, open it."]
+        assert [(s.is_question, s.is_transition, s.has_emphasis) for s in parsed] == [
+            (False, False, False), (True, False, True), (False, False, False),
+            (False, True, False), (False, False, False),
+        ]
+
+
+class TestDataclasses:
+    """Test parser result containers."""
+
+    def test_results_use_slots(self):
+        """Test that per-sentence objects carry no instance __dict__."""
+        sentence = ParsedSentence(text="Click save.", raw_text="Click save.", sentence_index=0)
+        metadata = TranscriptMetadata(total_sentences=1, total_speakers=0)
+
+        assert not hasattr(sentence, "__dict__")
+        assert not hasattr(metadata, "__dict__")
+        assert metadata.speaker_names == []
+        with pytest.raises(AttributeError):
+            sentence.unknown_flag = True
+
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v"])